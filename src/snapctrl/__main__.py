@@ -24,6 +24,7 @@ from snapctrl.core.state import StateStore
 from snapctrl.core.worker import SnapcastWorker
 from snapctrl.models.source import Source
 from snapctrl.ui.main_window import MainWindow
+from snapctrl.ui.panels.sources import install_album_art_disk_cache
 from snapctrl.ui.system_tray import SystemTrayManager
 from snapctrl.ui.theme import theme_manager
 
@@ -179,6 +180,7 @@ def main() -> int:  # noqa: PLR0912, PLR0915
 
     # Create core components
     config = ConfigManager()
+    install_album_art_disk_cache()
 
     # Apply theme from preferences (or auto-detect)
     saved_theme = config.get_theme()
@@ -1,11 +1,12 @@
 """Base album art provider and fallback chain.
 
-Defines the provider protocol and a fallback chain that tries
-multiple providers in order until one succeeds.
+Defines the provider protocol and a fallback chain that queries
+providers in priority order, keeping the best-ranked success.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import urllib.error
 from abc import ABC, abstractmethod
@@ -13,6 +14,11 @@ from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Seconds a provider gets to answer before the next one is queried as well;
+# well above a typical iTunes lookup, so MusicBrainz (1 request/second rate
+# limit) is normally only asked after a miss
+FALLBACK_HEDGE_DELAY = 2.0
+
 
 @dataclass(frozen=True)
 class AlbumArt:
@@ -63,9 +69,17 @@ class AlbumArtProvider(ABC):
 
 
 class FallbackAlbumArtProvider(AlbumArtProvider):
-    """Album art provider that tries multiple providers in order.
+    """Album art provider that tries multiple providers in priority order.
+
+    Each provider is queried once every provider ahead of it has come up
+    empty, or once the one ahead of it has taken longer than the hedge
+    delay, so a slow primary does not hold up the fallback for its full
+    timeout. The result of the first provider (in list order) that returns
+    valid art wins.
 
-    Stops at the first provider that returns valid art.
+    Lookups still running when a result is chosen are cancelled, but only
+    on a best-effort basis: providers doing blocking I/O in an executor
+    finish their in-flight request regardless.
 
     Example:
         provider = FallbackAlbumArtProvider([
@@ -75,13 +89,18 @@ class FallbackAlbumArtProvider(AlbumArtProvider):
         art = await provider.fetch("Fatboy Slim", "That Old Pair of Jeans")
     """
 
-    def __init__(self, providers: list[AlbumArtProvider]) -> None:
+    def __init__(
+        self, providers: list[AlbumArtProvider], hedge_delay: float = FALLBACK_HEDGE_DELAY
+    ) -> None:
         """Initialize with a list of providers to try.
 
         Args:
             providers: Providers to try in order.
+            hedge_delay: Seconds to wait on a provider before also querying
+                the next one.
         """
         self._providers = providers
+        self._hedge_delay = hedge_delay
 
     @property
     def name(self) -> str:
@@ -90,7 +109,7 @@ class FallbackAlbumArtProvider(AlbumArtProvider):
         return f"Fallback({', '.join(names)})"
 
     async def fetch(self, artist: str, album: str, title: str = "") -> AlbumArt | None:
-        """Try each provider until one succeeds.
+        """Query providers in order and return the highest-priority success.
 
         Args:
             artist: Artist name.
@@ -103,10 +122,27 @@ class FallbackAlbumArtProvider(AlbumArtProvider):
         if not artist:
             return None
 
-        for provider in self._providers:
-            try:
-                art = await provider.fetch(artist, album, title)
-                if art and art.is_valid:
+        providers = self._providers
+        tasks: list[asyncio.Future[AlbumArt | None]] = []
+
+        def start_next() -> None:
+            provider = providers[len(tasks)]
+            tasks.append(asyncio.ensure_future(self._fetch_from(provider, artist, album, title)))
+
+        try:
+            # Await in priority order: a later provider's art is only used
+            # once every provider ahead of it has come up empty
+            for index, provider in enumerate(providers):
+                if len(tasks) == index:
+                    start_next()
+                task = tasks[index]
+                if len(tasks) < len(providers):
+                    done, _ = await asyncio.wait({task}, timeout=self._hedge_delay)
+                    if not done:
+                        # Slow answer: query the next provider alongside it
+                        start_next()
+                art = await task
+                if art is not None:
                     logger.debug(
                         "Album art found via %s for %s - %s",
                         provider.name,
@@ -114,14 +150,26 @@ class FallbackAlbumArtProvider(AlbumArtProvider):
                         album or title,
                     )
                     return art
-            except (urllib.error.URLError, TimeoutError, OSError) as e:
-                # Network errors are expected when providers are unavailable
-                logger.debug("%s network error for %s - %s: %s", provider.name, artist, album, e)
-            except Exception as e:  # noqa: BLE001
-                # Unexpected errors should be logged at warning level
-                logger.warning(
-                    "%s unexpected error for %s - %s: %s", provider.name, artist, album, e
-                )
+        finally:
+            for task in tasks:
+                task.cancel()
 
         logger.debug("No album art found for %s - %s", artist, album or title)
         return None
+
+    @staticmethod
+    async def _fetch_from(
+        provider: AlbumArtProvider, artist: str, album: str, title: str
+    ) -> AlbumArt | None:
+        """Fetch from one provider, turning errors and invalid art into None."""
+        try:
+            art = await provider.fetch(artist, album, title)
+        except (urllib.error.URLError, TimeoutError, OSError) as e:
+            # Network errors are expected when providers are unavailable
+            logger.debug("%s network error for %s - %s: %s", provider.name, artist, album, e)
+            return None
+        except Exception as e:  # noqa: BLE001
+            # Unexpected errors should be logged at warning level
+            logger.warning("%s unexpected error for %s - %s: %s", provider.name, artist, album, e)
+            return None
+        return art if art and art.is_valid else None
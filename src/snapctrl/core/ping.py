@@ -11,6 +11,8 @@ import re
 import subprocess
 import threading
 import time
+from bisect import bisect_right
+from collections.abc import Callable
 
 from PySide6.QtCore import QObject, Signal
 
@@ -218,6 +220,22 @@ class RttThresholds:
     WARN = 100
 
 
+# Lookup tables: bisect the thresholds once instead of walking if/elif ladders.
+# Index i applies to values in [thresholds[i-1], thresholds[i]).
+_RTT_FORMAT_THRESHOLDS = (1, RttThresholds.PRECISION)
+_RTT_FORMATTERS: tuple[Callable[[float], str], ...] = (
+    lambda _ms: "<1ms",
+    "{:.1f}ms".format,
+    lambda ms: f"{int(ms)}ms",
+)
+_RTT_COLOR_THRESHOLDS = (RttThresholds.GOOD, RttThresholds.WARN)
+_RTT_COLORS = (
+    "#80ff80",  # Green - good
+    "#ffff80",  # Yellow - warning
+    "#ff8080",  # Red - high latency
+)
+
+
 def format_rtt(rtt_ms: float | None) -> str:
     """Format RTT for display.
 
@@ -229,11 +247,7 @@ def format_rtt(rtt_ms: float | None) -> str:
     """
     if rtt_ms is None:
         return "N/A"
-    if rtt_ms < 1:
-        return "<1ms"
-    if rtt_ms < RttThresholds.PRECISION:
-        return f"{rtt_ms:.1f}ms"
-    return f"{int(rtt_ms)}ms"
+    return _RTT_FORMATTERS[bisect_right(_RTT_FORMAT_THRESHOLDS, rtt_ms)](rtt_ms)
 
 
 def get_rtt_color(rtt_ms: float) -> str:
@@ -245,8 +259,4 @@ def get_rtt_color(rtt_ms: float) -> str:
     Returns:
         HTML color code: green for good, yellow for warning, red for high latency.
     """
-    if rtt_ms < RttThresholds.GOOD:
-        return "#80ff80"  # Green - good
-    if rtt_ms < RttThresholds.WARN:
-        return "#ffff80"  # Yellow - warning
-    return "#ff8080"  # Red - high latency
+    return _RTT_COLORS[bisect_right(_RTT_COLOR_THRESHOLDS, rtt_ms)]
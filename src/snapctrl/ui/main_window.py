@@ -6,13 +6,20 @@ Layout:
 | Panel   | Panel    | Panel       |
 | (left)  | (center) | (right)     |
 +----------------------------------+
+
+Thread contract:
+    Panel-to-window signals are emitted and handled on the GUI thread, so they
+    are connected with DirectConnection. StateStore is updated on the GUI
+    thread too (worker state arrives through a queued connection before it
+    reaches the store), so its signals use the default AutoConnection and
+    panels update synchronously, without another event-loop round trip.
 """
 
 import logging
 from typing import TYPE_CHECKING
 
-from PySide6.QtCore import Signal, Slot
-from PySide6.QtGui import QCloseEvent
+from PySide6.QtCore import Qt, QTimer, Signal, Slot
+from PySide6.QtGui import QCloseEvent, QShowEvent
 from PySide6.QtWidgets import QHBoxLayout, QLabel, QMainWindow, QPushButton, QSplitter, QWidget
 
 from snapctrl.core.config import ConfigManager
@@ -28,10 +35,25 @@ from snapctrl.ui.tokens import sizing, spacing, typography
 
 logger = logging.getLogger(__name__)
 
+# Coalescing window for selected-client refreshes driven by ping/stats polling
+_CLIENT_REFRESH_MS = 100
+
 if TYPE_CHECKING:
     from snapctrl.core.controller import Controller
 
 
+def _card_fields_fingerprint(clients: list[Client]) -> int:
+    """Hash the client fields shown on group cards, ignoring client order.
+
+    Args:
+        clients: Clients to fingerprint.
+
+    Returns:
+        A hash that changes when any card-visible client field changes.
+    """
+    return hash(frozenset((c.id, c.name, c.volume, c.muted, c.connected) for c in clients))
+
+
 class MainWindow(QMainWindow):
     """Main application window with tri-pane layout.
 
@@ -72,13 +94,25 @@ class MainWindow(QMainWindow):
         self._selected_client_id: str | None = None  # Track selected client for properties updates
         self._ping_results: dict[str, float | None] = {}  # client_id -> RTT ms
         self._time_stats: dict[str, dict[str, object]] = {}  # client_id -> stats
+        # Fingerprint of the client fields shown on group cards at the last
+        # refresh; None forces the next client update through
+        self._clients_fingerprint: int | None = None
+
+        # Background refreshes of the selected client (ping, time stats, state
+        # updates) are coalesced into one render, and skipped while hidden
+        self._client_refresh_timer = QTimer(self)
+        self._client_refresh_timer.setSingleShot(True)
+        self._client_refresh_timer.setInterval(_CLIENT_REFRESH_MS)
+        self._client_refresh_timer.timeout.connect(self._refresh_selected_client)
+        self._client_refresh_pending = False
 
         # Cache for status bar stylesheets to avoid repeated generation
         self._status_style_cache: dict[str, str] = {}
         self._snapclient_style_cache: dict[str, tuple[str, str]] = {}  # status -> (text, style)
 
+        # Window/base widget colors come from the app-wide stylesheet installed
+        # by theme_manager.apply_theme(), so Qt resolves them once for all widgets.
         self._setup_ui()
-        self._setup_style()
         self._connect_signals()
 
         # Connect theme changes to refresh styles
@@ -87,6 +121,8 @@ class MainWindow(QMainWindow):
     def _setup_ui(self) -> None:
         """Set up the user interface."""
         self.setWindowTitle("SnapCTRL")
+        # Base window/widget rules in the app-wide stylesheet are scoped to it
+        self.setObjectName("MainWindow")
         self.setMinimumSize(900, 600)
 
         # Create central widget with main layout
@@ -179,21 +215,6 @@ class MainWindow(QMainWindow):
 
         self.statusBar().setStyleSheet(f"background-color: {p.background};")
 
-    def _setup_style(self) -> None:
-        """Set up basic styling."""
-        p = theme_manager.palette
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: {p.background};
-            }}
-            QWidget {{
-                background-color: {p.surface};
-                color: {p.text};
-                font-family: {typography.font_family};
-                font-size: {typography.subtitle}pt;
-            }}
-        """)
-
     def _refresh_theme(self) -> None:
         """Refresh all styles when theme changes."""
         p = theme_manager.palette
@@ -202,9 +223,6 @@ class MainWindow(QMainWindow):
         self._status_style_cache.clear()
         self._snapclient_style_cache.clear()
 
-        # Re-apply main window stylesheet
-        self._setup_style()
-
         # Re-apply server label style
         self._server_label.setStyleSheet(
             f"color: {p.text_secondary};"
@@ -248,13 +266,12 @@ class MainWindow(QMainWindow):
         if not self._state:
             return
 
-        # Connect sources
-        self._state.sources_changed.connect(self._on_sources_changed)
+        direct = Qt.ConnectionType.DirectConnection
 
-        # Connect groups
+        # StateStore emits on the GUI thread, so AutoConnection calls these
+        # slots directly; it would still queue if a store were fed elsewhere
+        self._state.sources_changed.connect(self._on_sources_changed)
         self._state.groups_changed.connect(self._on_groups_changed)
-
-        # Connect clients
         self._state.clients_changed.connect(self._on_clients_changed)
 
         # Wire controller to group panel
@@ -262,16 +279,16 @@ class MainWindow(QMainWindow):
             self._controller.connect_to_group_panel(self._groups_panel)
 
         # Connect source selection to controller
-        self._sources_panel.source_selected.connect(self._on_source_selected)
+        self._sources_panel.source_selected.connect(self._on_source_selected, direct)
 
         # Auto-select first group when a group is selected
-        self._groups_panel.group_selected.connect(self._on_group_selected)
+        self._groups_panel.group_selected.connect(self._on_group_selected, direct)
 
         # Note: volume/mute signals are connected in __main__.py to worker
         # Don't connect them here to avoid duplicate handlers
 
         # Connect client selection for properties panel
-        self._groups_panel.client_selected.connect(self._on_client_selected)
+        self._groups_panel.client_selected.connect(self._on_client_selected, direct)
 
     @Slot(str)
     def _on_source_selected(self, source_id: str) -> None:
@@ -364,6 +381,8 @@ class MainWindow(QMainWindow):
                     break
 
         self._groups_panel.set_groups(groups, sources, clients_by_group)
+        # Cards were rebuilt from the store; don't skip the next client update
+        self._clients_fingerprint = None
 
         # Auto-select first group if none selected
         if groups and not self._groups_panel.selected_group_id:
@@ -376,33 +395,30 @@ class MainWindow(QMainWindow):
         Args:
             clients: New list of clients.
         """
-        # Update existing group cards with new client data
-        groups = self._state.groups if self._state else []
-        sources = self._state.sources if self._state else []
+        # Skip the group card refresh when no card-visible client field changed
+        # (e.g. only last_seen or latency did)
+        fingerprint = _card_fields_fingerprint(clients)
+        if fingerprint != self._clients_fingerprint:
+            self._clients_fingerprint = fingerprint
 
-        # Group clients by their group ID
-        clients_by_group: dict[str, list[Client]] = {}
-        for client in clients:
-            for group in groups:
-                if client.id in group.client_ids:
-                    if group.id not in clients_by_group:
-                        clients_by_group[group.id] = []
-                    clients_by_group[group.id].append(client)
-                    break
+            # Update existing group cards with new client data
+            groups = self._state.groups if self._state else []
+            sources = self._state.sources if self._state else []
 
-        self._groups_panel.set_groups(groups, sources, clients_by_group)
+            # Group clients by their group ID
+            clients_by_group: dict[str, list[Client]] = {}
+            for client in clients:
+                for group in groups:
+                    if client.id in group.client_ids:
+                        if group.id not in clients_by_group:
+                            clients_by_group[group.id] = []
+                        clients_by_group[group.id].append(client)
+                        break
+
+            self._groups_panel.set_groups(groups, sources, clients_by_group)
 
         # Update properties panel if selected client was updated
-        if self._selected_client_id and self._state:
-            client = self._state.get_client(self._selected_client_id)
-            if client:
-                rtt = self._ping_results.get(self._selected_client_id)
-                stats = self._time_stats.get(self._selected_client_id)
-                self._properties_panel.set_client(
-                    client,
-                    network_rtt=rtt,
-                    time_stats=stats,
-                )
+        self._schedule_client_refresh()
 
     @property
     def sources_panel(self) -> SourcesPanel:
@@ -437,16 +453,7 @@ class MainWindow(QMainWindow):
         """
         self._ping_results = results
         # Update properties panel if a client is selected
-        if self._selected_client_id and self._state:
-            client = self._state.get_client(self._selected_client_id)
-            if client:
-                rtt = results.get(self._selected_client_id)
-                stats = self._time_stats.get(self._selected_client_id)
-                self._properties_panel.set_client(
-                    client,
-                    network_rtt=rtt,
-                    time_stats=stats,
-                )
+        self._schedule_client_refresh()
 
     def set_time_stats(
         self,
@@ -459,17 +466,44 @@ class MainWindow(QMainWindow):
         """
         self._time_stats = results
         # Update properties panel if a client is selected
+        self._schedule_client_refresh()
+
+    def _schedule_client_refresh(self) -> None:
+        """Queue a coalesced properties refresh for the selected client."""
+        if self._selected_client_id and not self._client_refresh_timer.isActive():
+            self._client_refresh_timer.start()
+
+    @Slot()
+    def _refresh_selected_client(self) -> None:
+        """Render the selected client's latest properties.
+
+        While the window is hidden the render is deferred to the next showEvent.
+        """
+        if not self.isVisible():
+            self._client_refresh_pending = True
+            return
+        self._client_refresh_pending = False
         if self._selected_client_id and self._state:
             client = self._state.get_client(self._selected_client_id)
             if client:
                 rtt = self._ping_results.get(self._selected_client_id)
-                stats = results.get(self._selected_client_id)
+                stats = self._time_stats.get(self._selected_client_id)
                 self._properties_panel.set_client(
                     client,
                     network_rtt=rtt,
                     time_stats=stats,
                 )
 
+    def showEvent(self, event: QShowEvent) -> None:  # noqa: N802
+        """Flush a properties refresh deferred while the window was hidden.
+
+        Args:
+            event: The show event.
+        """
+        super().showEvent(event)
+        if self._client_refresh_pending:
+            self._refresh_selected_client()
+
     def set_connection_status(self, connected: bool, message: str = "") -> None:
         """Update the connection status indicator.
 
@@ -495,6 +529,10 @@ class MainWindow(QMainWindow):
                     f" border-radius: {sizing.border_radius_sm}px;"
                 )
 
+        if not connected:
+            # State is rebuilt after reconnecting; refresh cards unconditionally
+            self._clients_fingerprint = None
+
         text = message or ("Connected" if connected else "Disconnected")
         self._status_label.setText(text)
         self._status_label.setStyleSheet(self._status_style_cache[cache_key])
@@ -567,7 +605,7 @@ class MainWindow(QMainWindow):
             getattr(self, "_server_port", 1705),
             getattr(self, "_server_hostname", ""),
         )
-        dialog.settings_changed.connect(self.preferences_applied.emit)
+        dialog.settings_changed.connect(self.preferences_applied)
         dialog.open()
 
     def set_hide_to_tray(self, enabled: bool) -> None:
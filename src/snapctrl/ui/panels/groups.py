@@ -1,6 +1,6 @@
 """Groups panel - displays list of group cards in a scrollable area."""
 
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
     QLabel,
     QScrollArea,
@@ -139,10 +139,11 @@ class GroupsPanel(QWidget):
         for group in groups:
             group_clients = clients.get(group.id) if clients else None
 
-            if group.id in self._group_cards:
+            # Single lookup: existing cards keep their expanded state across updates
+            existing_card = self._group_cards.get(group.id)
+            if existing_card is not None:
                 # Update existing card in place (no recreation!)
-                card = self._group_cards[group.id]
-                card.update_from_state(group, sources or [], group_clients)
+                existing_card.update_from_state(group, sources or [], group_clients)
             else:
                 # Create new card only for new groups
                 card = GroupCard(group)
@@ -150,20 +151,23 @@ class GroupsPanel(QWidget):
                 if group_clients:
                     card.update_clients(group_clients)
 
-                # Connect card signals to panel signals
-                card.volume_changed.connect(self.volume_changed.emit)
-                card.mute_toggled.connect(self.mute_toggled.emit)
-                card.source_changed.connect(self.source_changed.emit)
-                card.clicked.connect(lambda gid=group.id: self._on_card_clicked(gid))
+                # Chain card signals to panel signals; Qt relays these without
+                # calling into Python. Cards live on the GUI thread, so skip
+                # AutoConnection's per-emit thread check.
+                direct = Qt.ConnectionType.DirectConnection
+                card.volume_changed.connect(self.volume_changed, direct)
+                card.mute_toggled.connect(self.mute_toggled, direct)
+                card.source_changed.connect(self.source_changed, direct)
+                card.clicked.connect(lambda gid=group.id: self._on_card_clicked(gid), direct)
 
                 # Connect client signals to panel signals
-                card.client_volume_changed.connect(self.client_volume_changed.emit)
-                card.client_mute_toggled.connect(self.client_mute_toggled.emit)
-                card.client_clicked.connect(self.client_selected.emit)
+                card.client_volume_changed.connect(self.client_volume_changed, direct)
+                card.client_mute_toggled.connect(self.client_mute_toggled, direct)
+                card.client_clicked.connect(self.client_selected, direct)
 
                 # Connect rename signals
-                card.rename_requested.connect(self.group_rename_requested.emit)
-                card.client_rename_requested.connect(self.client_rename_requested.emit)
+                card.rename_requested.connect(self.group_rename_requested, direct)
+                card.client_rename_requested.connect(self.client_rename_requested, direct)
 
                 self._group_cards[group.id] = card
                 # Insert before the stretch
@@ -1,5 +1,7 @@
 """Properties panel - displays details of selected item."""
 
+from functools import lru_cache
+from html import escape
 from typing import Any
 
 from PySide6.QtCore import Qt, Signal
@@ -11,7 +13,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from snapctrl.core.ping import format_rtt, get_rtt_color
+from snapctrl.core.ping import RttThresholds, format_rtt, get_rtt_color
 from snapctrl.models.client import Client
 from snapctrl.models.group import Group
 from snapctrl.models.source import Source
@@ -21,6 +23,39 @@ from snapctrl.ui.tokens import spacing, typography
 _JITTER_US_THRESHOLD = 0.001  # Below this, show as 0µs
 _JITTER_PRECISION_THRESHOLD = 10  # Below this, show one decimal
 _MS_TO_US = 1000  # Milliseconds to microseconds conversion
+_FRAGMENT_CACHE_SIZE = 128  # Escaped HTML fragments kept across refreshes
+_RTT_CACHE_SIZE = 512  # Distinct RTT cells; stable networks repeat a handful
+
+_CELLPADDING = spacing.xs
+_CAPTION_PT = typography.caption
+_CONTENT_ALIGN = Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft
+_PLACEHOLDER_TEXT = "Select an item to see details"
+_HEADER_STYLE = f"font-weight: bold; font-size: {typography.title}pt;"
+
+
+# HTML row builders. Small functions returning f-strings measured fastest on
+# CPython 3.11 (vs. str.format and %-templates), and each emits a single line
+# so Qt's rich-text parser has no whitespace runs to walk and collapse.
+def _page(title: str, rows: str) -> str:
+    """Wrap table rows in the page layout under a heading."""
+    return f'<h3>{title}</h3><table cellpadding="{_CELLPADDING}">{rows}</table>'
+
+
+def _row(label: str, value: object) -> str:
+    """Render a key/value table row."""
+    return f"<tr><td><i>{label}:</i></td><td>{value}</td></tr>"
+
+
+def _color_row(label: str, color: str, value: object) -> str:
+    """Render a key/value table row with a colored value cell."""
+    return f"<tr><td><i>{label}:</i></td><td style='color: {color};'>{value}</td></tr>"
+
+
+def _client_id_row(client_id: str) -> str:
+    """Render the de-emphasized client ID row."""
+    return (
+        f"<tr><td><i>ID:</i></td><td style='font-size: {_CAPTION_PT}pt;'>{client_id}...</td></tr>"
+    )
 
 
 def _format_jitter(ms: float) -> str:
@@ -34,6 +69,60 @@ def _format_jitter(ms: float) -> str:
     return f"{int(ms)}ms"
 
 
+# Model text is escaped once per distinct value; polling refreshes of the same
+# item then reuse the cached fragments instead of re-escaping every field.
+_escape = lru_cache(maxsize=_FRAGMENT_CACHE_SIZE)(escape)
+
+
+@lru_cache(maxsize=_FRAGMENT_CACHE_SIZE)
+def _content_style(color: str) -> str:
+    """Return the content label stylesheet for a text color.
+
+    Cached so repeated refreshes hand _show_content the same string object,
+    making its unchanged-style check an identity hit.
+    """
+    return f"color: {color};"
+
+
+@lru_cache(maxsize=_RTT_CACHE_SIZE)
+def _rtt_cell(rtt_ms: float) -> tuple[str, str]:
+    """Return the escaped display text and color for an RTT value.
+
+    Callers quantize to whole milliseconds at or above the precision
+    threshold, where format_rtt truncates anyway, so repeated polls hit.
+    """
+    return format_rtt(rtt_ms).replace("<", "&lt;"), get_rtt_color(rtt_ms)
+
+
+@lru_cache(maxsize=_FRAGMENT_CACHE_SIZE)
+def _client_static_rows(system: str, version: str, mac: str, client_id: str) -> str:
+    """Render the client rows that only change with the client's identity."""
+    rows: list[str] = []
+    if system:
+        rows.append(_row("System", escape(system)))
+    if version:
+        rows.append(_row("Snapclient", escape(version)))
+    if mac:
+        rows.append(_row("MAC", escape(mac)))
+    # Client ID (less prominent at bottom)
+    rows.append(_client_id_row(escape(client_id[:16])))
+    return "".join(rows)
+
+
+@lru_cache(maxsize=_FRAGMENT_CACHE_SIZE)
+def _source_static_rows(scheme: str, codec: str, fmt: str, source_id: str) -> str:
+    """Render the source rows that only change with the stream's configuration."""
+    rows: list[str] = []
+    if scheme:
+        rows.append(_row("Type", escape(scheme)))
+    if codec:
+        rows.append(_row("Codec", escape(codec)))
+    if fmt:
+        rows.append(_row("Format", escape(fmt)))
+    rows.append(_row("ID", escape(source_id)))
+    return "".join(rows)
+
+
 class PropertiesPanel(QWidget):
     """Right panel showing details of selected item.
 
@@ -58,13 +147,14 @@ class PropertiesPanel(QWidget):
 
         # Header
         self._header = QLabel("Properties")
-        self._header.setStyleSheet(f"font-weight: bold; font-size: {typography.title}pt;")
+        self._header.setStyleSheet(_HEADER_STYLE)
         layout.addWidget(self._header)
 
-        # Content area (placeholder for now)
+        # Content area: starts as a plain-text placeholder; rich text (HTML)
+        # rendering is only enabled on first selection by _ensure_built()
         p = theme_manager.palette
-        self._content = QLabel("Select an item to see details")
-        self._content.setTextFormat(Qt.TextFormat.RichText)  # Enable HTML rendering
+        self._content = QLabel(_PLACEHOLDER_TEXT)
+        self._content.setTextFormat(Qt.TextFormat.PlainText)
         self._content.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self._content.setStyleSheet(f"color: {p.text_disabled}; font-style: italic;")
         self._content.setWordWrap(True)
@@ -74,14 +164,54 @@ class PropertiesPanel(QWidget):
         self._latency_widget: QWidget | None = None
         self._latency_spinbox: QSpinBox | None = None
         self._current_client_id: str | None = None
+        self._built = False
+
+        # Last values pushed to _content; identical refreshes become a string
+        # compare instead of a rich-text re-parse and style re-polish
+        self._last_html: str | None = None
+        self._last_style: str | None = None
+        self._last_align: Qt.AlignmentFlag | None = None
 
         layout.addStretch()
 
+    def _ensure_built(self) -> None:
+        """Prepare the content label for property display on first selection."""
+        if self._built:
+            return
+        self._built = True
+        self._content.setTextFormat(Qt.TextFormat.RichText)  # Enable HTML rendering
+
+    def _show_content(
+        self,
+        html: str,
+        style: str,
+        align: Qt.AlignmentFlag | None = _CONTENT_ALIGN,
+    ) -> None:
+        """Push text, style and alignment to the content label, skipping no-ops.
+
+        Args:
+            html: Text (or HTML) to display.
+            style: Stylesheet for the content label.
+            align: Alignment to apply, or None to leave it unchanged.
+        """
+        if html != self._last_html:
+            self._content.setText(html)
+            self._last_html = html
+        if style != self._last_style:
+            self._content.setStyleSheet(style)
+            self._last_style = style
+        if align is not None and align != self._last_align:
+            self._content.setAlignment(align)
+            self._last_align = align
+
     def clear(self) -> None:
         """Clear the properties panel."""
         p = theme_manager.palette
-        self._content.setText("Select an item to see details")
-        self._content.setStyleSheet(f"color: {p.text_disabled}; font-style: italic;")
+        self._show_content(
+            _PLACEHOLDER_TEXT,
+            f"color: {p.text_disabled}; font-style: italic;",
+            align=None,
+        )
         self._remove_latency_widget()
 
     def set_group(self, group: Group) -> None:
@@ -90,20 +220,17 @@ class PropertiesPanel(QWidget):
         Args:
             group: Group to display.
         """
+        self._ensure_built()
         self._remove_latency_widget()
         mute_status = "Muted" if group.muted else "Active"
-        html = f"""
-            <h3>{group.name}</h3>
-            <table cellpadding="{spacing.xs}">
-            <tr><td><i>ID:</i></td><td>{group.id}</td></tr>
-            <tr><td><i>Status:</i></td><td>{mute_status}</td></tr>
-            <tr><td><i>Stream:</i></td><td>{group.stream_id}</td></tr>
-            <tr><td><i>Clients:</i></td><td>{len(group.client_ids)}</td></tr>
-            </table>
-        """
-        self._content.setText(html)
-        self._content.setStyleSheet(f"color: {theme_manager.palette.text};")
-        self._content.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+        html = _page(
+            _escape(group.name),
+            _row("ID", _escape(group.id))
+            + _row("Status", mute_status)
+            + _row("Stream", _escape(group.stream_id))
+            + _row("Clients", len(group.client_ids)),
+        )
+        self._show_content(html, _content_style(theme_manager.palette.text))
 
     def set_client(
         self,
@@ -118,108 +245,92 @@ class PropertiesPanel(QWidget):
             network_rtt: Optional network RTT in ms from ping (status bar fallback).
             time_stats: Optional server-measured latency stats from Client.GetTimeStats.
         """
+        self._ensure_built()
         p = theme_manager.palette
-        status = "Connected" if client.connected else "Disconnected"
-        status_color = p.success if client.connected else p.error
-
-        # Build optional rows
-        rows: list[str] = []
-        rows.append(f"<tr><td><i>Host:</i></td><td>{client.host}</td></tr>")
-        rows.append(
-            f"<tr><td><i>Status:</i></td><td style='color: {status_color};'>{status}</td></tr>"
-        )
-        rows.append(f"<tr><td><i>Volume:</i></td><td>{client.volume}%</td></tr>")
-        rows.append(f"<tr><td><i>Muted:</i></td><td>{'Yes' if client.muted else 'No'}</td></tr>")
-
-        # Server-side latency stats (preferred) or fallback to ping RTT
-        samples = time_stats.get("samples", 0) if time_stats else 0
-        if time_stats and isinstance(samples, (int, float)) and samples > 0:
-            self._add_time_stats_rows(rows, time_stats)
-        elif network_rtt is not None:
-            rtt_str = format_rtt(network_rtt).replace("<", "&lt;")
-            rtt_color = get_rtt_color(network_rtt)
-            rows.append(
-                f"<tr><td><i>Network RTT:</i></td>"
-                f"<td style='color: {rtt_color};'>{rtt_str}</td></tr>"
-            )
-        elif client.connected:
-            rows.append(
-                f"<tr><td><i>Latency:</i></td>"
-                f"<td style='color: {p.text_disabled};'>Measuring...</td></tr>"
-            )
-
-        # Latency offset — shown as interactive spinbox for connected clients,
-        # read-only text for disconnected clients
-        if not client.connected:
-            rows.append(
-                f"<tr><td><i>Latency offset:</i></td><td>{client.display_latency}</td></tr>"
-            )
-
-        # Last seen (timing info)
-        if client.last_seen_sec > 0:
-            rows.append(f"<tr><td><i>Last seen:</i></td><td>{client.last_seen_ago}</td></tr>")
-
-        # System info
-        if client.display_system:
-            rows.append(f"<tr><td><i>System:</i></td><td>{client.display_system}</td></tr>")
-
-        # Snapclient version
-        if client.snapclient_version:
-            rows.append(f"<tr><td><i>Snapclient:</i></td><td>{client.snapclient_version}</td></tr>")
-
-        # MAC address
-        if client.mac:
-            rows.append(f"<tr><td><i>MAC:</i></td><td>{client.mac}</td></tr>")
-
-        # Client ID (less prominent at bottom)
-        rows.append(
-            f"<tr><td><i>ID:</i></td><td style='font-size: {typography.caption}pt;'>"
-            f"{client.id[:16]}...</td></tr>"
+        # Snapshot fields read more than once below
+        connected = client.connected
+        host = client.host
+        status = "Connected" if connected else "Disconnected"
+        status_color = p.success if connected else p.error
+
+        # Optional rows render as "" when absent so the table is a single join
+        rows = "".join(
+            [
+                _row("Host", _escape(host)),
+                _color_row("Status", status_color, status),
+                _row("Volume", f"{client.volume}%"),
+                _row("Muted", "Yes" if client.muted else "No"),
+                self._latency_rows(client, network_rtt, time_stats),
+                # Latency offset — shown as interactive spinbox for connected
+                # clients, read-only text for disconnected clients
+                "" if connected else _row("Latency offset", client.display_latency),
+                # Last seen (timing info)
+                _row("Last seen", client.last_seen_ago) if client.last_seen_sec > 0 else "",
+                # System info, snapclient version, MAC address and ID
+                _client_static_rows(
+                    client.display_system, client.snapclient_version, client.mac, client.id
+                ),
+            ]
         )
 
-        html = f"""
-            <h3>{client.name or client.host}</h3>
-            <table cellpadding="{spacing.xs}">
-            {"".join(rows)}
-            </table>
-        """
-        self._content.setText(html)
-        self._content.setStyleSheet(f"color: {p.text};")
-        self._content.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+        html = _page(_escape(client.name or host), rows)
+        self._show_content(html, _content_style(p.text))
 
         # Add interactive latency control for connected clients
         self._remove_latency_widget()
-        if client.connected:
+        if connected:
             self._current_client_id = client.id
             self._add_latency_widget(client.latency)
 
     @staticmethod
-    def _add_time_stats_rows(
-        rows: list[str],
-        stats: dict[str, Any],
-    ) -> None:
-        """Add server-measured latency rows to the properties table."""
+    def _latency_rows(
+        client: Client,
+        network_rtt: float | None,
+        time_stats: dict[str, Any] | None,
+    ) -> str:
+        """Render the latency rows for a client.
+
+        Server-side latency stats are preferred, with ping RTT as fallback.
+
+        Returns:
+            HTML table rows, or "" when there is nothing to show.
+        """
+        samples = time_stats.get("samples", 0) if time_stats else 0
+        if time_stats and isinstance(samples, (int, float)) and samples > 0:
+            return PropertiesPanel._time_stats_rows(time_stats)
+        if network_rtt is not None:
+            # Above the precision threshold only whole ms are shown, and the
+            # color thresholds are whole ms too, so truncating is lossless
+            if network_rtt >= RttThresholds.PRECISION:
+                network_rtt = int(network_rtt)
+            rtt_str, rtt_color = _rtt_cell(network_rtt)
+            return _color_row("Network RTT", rtt_color, rtt_str)
+        if client.connected:
+            return _color_row("Latency", theme_manager.palette.text_disabled, "Measuring...")
+        return ""
+
+    @staticmethod
+    def _time_stats_rows(stats: dict[str, Any]) -> str:
+        """Render server-measured latency rows for the properties table."""
         try:
             median = float(stats.get("jitter_median_ms", 0.0))
             p95 = float(stats.get("jitter_p95_ms", 0.0))
             samples = int(stats.get("samples", 0))
         except (TypeError, ValueError):
-            return
+            return ""
 
         median_color = get_rtt_color(median)
         p95_color = get_rtt_color(p95)
         median_str = _format_jitter(median)
         p95_str = _format_jitter(p95)
 
-        rows.append(
-            f"<tr><td><i>Jitter (server):</i></td>"
-            f"<td style='color: {median_color};'>"
-            f"{median_str}</td></tr>"
-        )
-        rows.append(
-            f"<tr><td><i>Jitter P95:</i></td><td style='color: {p95_color};'>{p95_str}</td></tr>"
+        return "".join(
+            [
+                _color_row("Jitter (server)", median_color, median_str),
+                _color_row("Jitter P95", p95_color, p95_str),
+                _row("Samples", samples),
+            ]
         )
-        rows.append(f"<tr><td><i>Samples:</i></td><td>{samples}</td></tr>")
 
     def set_source(self, source: Source) -> None:
         """Display source properties.
@@ -227,42 +338,28 @@ class PropertiesPanel(QWidget):
         Args:
             source: Source to display.
         """
+        self._ensure_built()
         self._remove_latency_widget()
         p = theme_manager.palette
-        status = "Playing" if source.is_playing else "Idle"
-        status_color = p.success if source.is_playing else p.text_disabled
-
-        rows: list[str] = []
-        rows.append(
-            f"<tr><td><i>Status:</i></td><td style='color: {status_color};'>{status}</td></tr>"
+        playing = source.is_playing
+        status = "Playing" if playing else "Idle"
+        status_color = p.success if playing else p.text_disabled
+
+        rows = "".join(
+            [
+                _color_row("Status", status_color, status),
+                # Stream type / scheme, codec, sample format and stream ID
+                _source_static_rows(
+                    source.uri_scheme or source.stream_type,
+                    source.codec,
+                    source.display_format,
+                    source.id,
+                ),
+            ]
         )
 
-        # Stream type / scheme
-        scheme = source.uri_scheme or source.stream_type
-        if scheme:
-            rows.append(f"<tr><td><i>Type:</i></td><td>{scheme}</td></tr>")
-
-        # Codec
-        if source.codec:
-            rows.append(f"<tr><td><i>Codec:</i></td><td>{source.codec}</td></tr>")
-
-        # Sample format
-        fmt = source.display_format
-        if fmt:
-            rows.append(f"<tr><td><i>Format:</i></td><td>{fmt}</td></tr>")
-
-        # Stream ID
-        rows.append(f"<tr><td><i>ID:</i></td><td>{source.id}</td></tr>")
-
-        html = f"""
-            <h3>{source.name}</h3>
-            <table cellpadding="{spacing.xs}">
-            {"".join(rows)}
-            </table>
-        """
-        self._content.setText(html)
-        self._content.setStyleSheet(f"color: {p.text};")
-        self._content.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+        html = _page(_escape(source.name), rows)
+        self._show_content(html, _content_style(p.text))
 
     def set_local_snapclient(
         self,
@@ -281,6 +378,7 @@ class PropertiesPanel(QWidget):
             server_host: Connected server host.
             server_port: Connected server port.
         """
+        self._ensure_built()
         self._remove_latency_widget()
         p = theme_manager.palette
 
@@ -294,26 +392,16 @@ class PropertiesPanel(QWidget):
         status_label = status.capitalize()
 
         rows: list[str] = []
-        rows.append(
-            f"<tr><td><i>Status:</i></td>"
-            f"<td style='color: {status_color};'>{status_label}</td></tr>"
-        )
+        rows.append(_color_row("Status", status_color, status_label))
         if binary_path:
-            rows.append(f"<tr><td><i>Binary:</i></td><td>{binary_path}</td></tr>")
+            rows.append(_row("Binary", binary_path))
         if version:
-            rows.append(f"<tr><td><i>Version:</i></td><td>{version}</td></tr>")
+            rows.append(_row("Version", version))
         if server_host:
-            rows.append(f"<tr><td><i>Server:</i></td><td>{server_host}:{server_port}</td></tr>")
+            rows.append(_row("Server", f"{server_host}:{server_port}"))
 
-        html = f"""
-            <h3>Local Snapclient</h3>
-            <table cellpadding="{spacing.xs}">
-            {"".join(rows)}
-            </table>
-        """
-        self._content.setText(html)
-        self._content.setStyleSheet(f"color: {p.text};")
-        self._content.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+        html = _page("Local Snapclient", "".join(rows))
+        self._show_content(html, _content_style(p.text))
 
     def _add_latency_widget(self, current_latency: int) -> None:
         """Add an interactive latency spinbox below the content.
@@ -366,4 +454,5 @@ class PropertiesPanel(QWidget):
         self._header.setStyleSheet(
             f"font-weight: bold; font-size: {typography.title}pt; color: {p.text};"
         )
-        self._content.setStyleSheet(f"color: {p.text};")
+        self._last_style = _content_style(p.text)
+        self._content.setStyleSheet(self._last_style)
@@ -1,22 +1,46 @@
 """Sources panel - displays list of audio sources."""
 
 import asyncio
-import base64
-import binascii
+import concurrent.futures
 import ipaddress
+import itertools
 import logging
+import re
 import threading
+from functools import cache, lru_cache, partial
+from html import escape
 from urllib.parse import urlparse, urlunparse
 
-from PySide6.QtCore import QEvent, Qt, QTimer, QUrl, Signal, Slot
-from PySide6.QtGui import QPixmap
-from PySide6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
+from PySide6.QtCore import (
+    QBuffer,
+    QByteArray,
+    QCoreApplication,
+    QEvent,
+    QModelIndex,
+    QPersistentModelIndex,
+    QSignalBlocker,
+    QStandardPaths,
+    Qt,
+    QTimer,
+    QUrl,
+    Signal,
+    Slot,
+)
+from PySide6.QtGui import QColor, QImage, QImageReader, QPalette, QPixmap, QPixmapCache
+from PySide6.QtNetwork import (
+    QNetworkAccessManager,
+    QNetworkDiskCache,
+    QNetworkReply,
+    QNetworkRequest,
+)
 from PySide6.QtWidgets import (
     QFrame,
     QLabel,
     QListWidget,
     QListWidgetItem,
     QProgressBar,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QVBoxLayout,
     QWidget,
 )
@@ -37,8 +61,25 @@ ALBUM_ART_SIZE = sizing.album_art
 
 # Maximum album art data size (10MB base64 ≈ 7.5MB decoded)
 MAX_ALBUM_ART_B64_SIZE = 10 * 1024 * 1024
+# Same budget for HTTP art, in decoded bytes; larger downloads are aborted
+MAX_HTTP_ART_SIZE = MAX_ALBUM_ART_B64_SIZE * 3 // 4
+# Longest data URI header ("data:<mime>;base64,") searched for the separator
+_DATA_URI_HEADER_MAX = 256
 _ART_HEIGHT_MAX_RETRIES = 3
 
+# Namespace for decoded album art in the application-wide QPixmapCache,
+# which bounds it by bytes and shares it between panels
+_ART_CACHE_PREFIX = "snapctrl-art:"
+
+# Album art URL schemes fetched over the network
+_HTTP_PREFIXES = ("http://", "https://")
+
+# Scheme and authority of an album art URL, matched in one pass
+_ART_URL_AUTHORITY_RE = re.compile(r"(https?)://([^/?#]*)")
+
+# On-disk HTTP cache for album art, kept across runs
+_ART_DISK_CACHE_SIZE = 64 * 1024 * 1024
+
 # Network request timeout (15 seconds)
 _NETWORK_TIMEOUT_MS = 15000
 
@@ -49,6 +90,183 @@ _SCALE_TOLERANCE_PX = 5
 # Ensures rescaling when album art changes to different aspect ratio.
 _ASPECT_RATIO_TOLERANCE = 0.01
 
+# Palette-independent stylesheets, built once at import
+_HEADER_STYLE = f"font-weight: bold; font-size: {typography.title}pt;"
+_ART_PIXMAP_STYLE = f"QLabel {{ border-radius: {sizing.border_radius_md}px; }}"
+
+
+@lru_cache(maxsize=4)
+def _art_background_style(background: str) -> str:
+    """Build the empty album art label stylesheet for a background color."""
+    return (
+        f"QLabel {{ background-color: {background}; border-radius: {sizing.border_radius_md}px; }}"
+    )
+
+
+@lru_cache(maxsize=4)
+def _art_placeholder_style(background: str, color: str) -> str:
+    """Build the 'No Art' placeholder stylesheet for the given colors."""
+    return (
+        f"QLabel {{ background-color: {background}; "
+        f"border-radius: {sizing.border_radius_md}px; color: {color}; }}"
+    )
+
+
+def _load_scaled_image(data: bytes | QByteArray, max_size: int) -> QImage | None:
+    """Decode image data straight to at most max_size on its longer side.
+
+    The image plugin downscales while decoding (JPEG DCT scaling), so large
+    covers never materialize as a full-resolution image first. Works on
+    QImage only, so it is safe to call from worker threads.
+
+    Args:
+        data: Encoded image bytes (JPEG, PNG, ...).
+        max_size: Maximum width/height of the decoded image in pixels.
+
+    Returns:
+        The decoded image, or None if the data is not a readable image.
+    """
+    buffer = QBuffer()
+    buffer.setData(data if isinstance(data, QByteArray) else QByteArray(data))
+    reader = QImageReader(buffer)
+    reader.setAutoTransform(True)
+    size = reader.size()
+    if size.width() > max_size or size.height() > max_size:
+        reader.setScaledSize(size.scaled(max_size, max_size, Qt.AspectRatioMode.KeepAspectRatio))
+    image = reader.read()
+    return None if image.isNull() else image
+
+
+def _load_scaled_pixmap(data: bytes | QByteArray, max_size: int) -> QPixmap | None:
+    """Decode image data like _load_scaled_image, as a pixmap (GUI thread only)."""
+    image = _load_scaled_image(data, max_size)
+    return None if image is None else QPixmap.fromImage(image)
+
+
+@cache
+def _shared_network_manager() -> QNetworkAccessManager:
+    """Return the application-wide network manager for album art requests.
+
+    One manager shares its connection pool, TLS session cache and disk
+    cache (see install_album_art_disk_cache) across panels. It is parented
+    to the application so it outlives any panel.
+    """
+    return QNetworkAccessManager(QCoreApplication.instance())
+
+
+def install_album_art_disk_cache(cache_dir: str | None = None) -> None:
+    """Give album art requests a bounded on-disk HTTP cache.
+
+    Called once at application startup; until then art is fetched uncached.
+
+    Args:
+        cache_dir: Cache directory. Defaults to ``album-art`` under the
+            platform cache location.
+    """
+    manager = _shared_network_manager()
+    if cache_dir is None:
+        cache_root = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+        cache_dir = f"{cache_root}/album-art"
+    disk_cache = QNetworkDiskCache(manager)
+    disk_cache.setCacheDirectory(cache_dir)
+    disk_cache.setMaximumCacheSize(_ART_DISK_CACHE_SIZE)
+    manager.setCache(disk_cache)
+
+
+@cache
+def _art_accept_header() -> bytes:
+    """Return the Accept header for album art, preferring WebP when decodable.
+
+    WebP covers are typically smaller than JPEG or PNG at equal quality,
+    but servers should only be offered it when the Qt image plugin is there.
+    """
+    if b"image/webp" in {bytes(mime.data()) for mime in QImageReader.supportedMimeTypes()}:
+        return b"image/webp,image/*;q=0.8"
+    return b"image/*"
+
+
+@cache
+def _fallback_art_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop that runs fallback album art fetches.
+
+    Started once and reused, so a lookup does not build and tear down a
+    thread, an event loop and its default executor every time.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="album-art", daemon=True).start()
+    return loop
+
+
+# Tags album art requests with their panel so panels sharing the network
+# manager only handle their own replies
+_panel_tags = itertools.count(1)
+
+
+# Item data roles, resolved once instead of per item access
+_SOURCE_ID_ROLE = Qt.ItemDataRole.UserRole  # Source ID of the row
+_PLAYING_ROLE = _SOURCE_ID_ROLE + 1  # Whether the row's source is playing
+
+
+class _PlayingSourceDelegate(QStyledItemDelegate):
+    """Item delegate that colors playing sources from one shared color.
+
+    Replaces per-item foreground brushes, so rows never carry their own
+    styling and the list's stylesheet is resolved once for all of them.
+    """
+
+    _PLAYING_COLOR = QColor(Qt.GlobalColor.green)
+
+    def initStyleOption(  # noqa: N802
+        self, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex
+    ) -> None:
+        """Apply the playing color to rows flagged with the playing role."""
+        super().initStyleOption(option, index)
+        if index.data(_PLAYING_ROLE):
+            option.palette.setColor(QPalette.ColorRole.Text, self._PLAYING_COLOR)
+
+
+@lru_cache(maxsize=32)
+def _now_playing_html(
+    title: str, artist: str, album: str, *, text: str, secondary: str, disabled: str
+) -> str:
+    """Build the now-playing markup: bold title, then artist and italic album.
+
+    The label mixes three text styles, so it stays rich text; cached per
+    track and palette so status polls reuse the markup.
+
+    Args:
+        title: Track title.
+        artist: Track artist.
+        album: Track album.
+        text: Title color.
+        secondary: Artist color.
+        disabled: Album color.
+    """
+    html = f"<b style='color: {text};'>{escape(title)}</b>"
+    if artist or album:
+        html += f"<br/><span style='color: {secondary};'>{escape(artist)}</span>"
+    if album:
+        html += f"<br/><span style='color: {disabled}; font-style: italic;'>{escape(album)}</span>"
+    return html
+
+
+def _set_label_text(label: QLabel, text: str) -> None:
+    """Set label text only when it differs, avoiding a needless re-layout."""
+    if label.text() != text:
+        label.setText(text)
+
+
+def _set_style(widget: QWidget, style: str) -> None:
+    """Set a stylesheet only when it differs, avoiding a needless re-parse."""
+    if widget.styleSheet() != style:
+        widget.setStyleSheet(style)
+
+
+def _set_shown(widget: QWidget, visible: bool) -> None:
+    """Toggle widget visibility only when it actually flips."""
+    if widget.isHidden() == visible:
+        widget.setVisible(visible)
+
 
 class SourcesPanel(QWidget):
     """Left panel showing list of audio sources.
@@ -78,11 +296,16 @@ class SourcesPanel(QWidget):
         """Initialize the sources panel."""
         super().__init__()
         self._sources: list[Source] = []
+        self._sources_by_id: dict[str, Source] = {}
+        self._items_by_id: dict[str, QListWidgetItem] = {}
 
-        # Network manager for fetching HTTP album art
-        self._network_manager = QNetworkAccessManager(self)
-        self._network_manager.finished.connect(self._on_http_art_finished)
+        # Shared network manager for fetching HTTP album art
+        self._reply_tag = next(_panel_tags)
+        self._network_manager = _shared_network_manager()
+        self._network_manager.finished.connect(self._on_network_reply)
         self._pending_art_url: str = ""  # Track pending request
+        self._last_art_url: str = ""  # Data URI shown or being decoded
+        self._current_reply: QNetworkReply | None = None  # Aborted when superseded
         self._server_host: str = ""  # Connection host for URL rewriting
 
         # Current source metadata for fallback lookup
@@ -90,15 +313,23 @@ class SourcesPanel(QWidget):
         self._current_album: str = ""
         self._current_title: str = ""
 
-        # Pending fallback art result (data, mime_type, source)
-        # Protected by _fallback_lock for thread-safe access from background threads
-        self._pending_fallback_art: tuple[bytes, str, str] | None = None
+        # Pending fallback art result (image, mime_type, source), decoded and
+        # scaled off the GUI thread. Protected by _fallback_lock for
+        # thread-safe access from background threads
+        self._pending_fallback_art: tuple[QImage, str, str] | None = None
         self._pending_fallback_generation: int = 0
         self._fallback_lock = threading.Lock()
 
         # Flag to cancel fallback when valid art arrives
         self._art_loaded: bool = False
 
+        # Art cache key (URL or track metadata) of the in-flight data URI
+        # decode / fallback fetch
+        self._pending_art_key: str = ""
+
+        # In-flight fallback fetch on the shared art loop (cancelled when superseded)
+        self._fallback_future: concurrent.futures.Future[None] | None = None
+
         # Connect internal signals for thread-safe art updates.
         # Explicit QueuedConnection is required because these signals are emitted
         # from plain Python threads (not QThread), ensuring the slot runs on the
@@ -131,29 +362,14 @@ class SourcesPanel(QWidget):
 
         # Header
         self._header = QLabel("Sources")
-        self._header.setStyleSheet(f"font-weight: bold; font-size: {typography.title}pt;")
+        self._header.setStyleSheet(_HEADER_STYLE)
         layout.addWidget(self._header)
 
-        # Source list
-        p = theme_manager.palette
+        # Source list. List, details and progress styling lives in the
+        # app-wide stylesheet (theme_manager.apply_theme), keyed on object names
         self._list = QListWidget()
-        self._list.setStyleSheet(f"""
-            QListWidget {{
-                background-color: {p.surface_dim};
-                border: none;
-                padding: {spacing.xs}px;
-            }}
-            QListWidget::item {{
-                padding: {spacing.sm}px;
-                border-radius: {sizing.border_radius_md}px;
-            }}
-            QListWidget::item:selected {{
-                background-color: {p.surface_hover};
-            }}
-            QListWidget::item:hover {{
-                background-color: {p.surface_elevated};
-            }}
-        """)
+        self._list.setObjectName("SourcesList")
+        self._list.setItemDelegate(_PlayingSourceDelegate(self._list))
         self._list.itemDoubleClicked.connect(self._on_item_double_clicked)
         self._list.currentItemChanged.connect(self._on_selection_changed)
         layout.addWidget(self._list)
@@ -165,22 +381,13 @@ class SourcesPanel(QWidget):
         """Set up the details section with album art and metadata labels."""
         p = theme_manager.palette
         self._details_frame = QFrame()
-        self._details_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {p.surface_dim};
-                border-radius: {sizing.border_radius_md}px;
-                padding: {spacing.sm}px;
-            }}
-            QLabel {{
-                color: {p.text_secondary};
-                font-size: {typography.small}pt;
-            }}
-        """)
+        self._details_frame.setObjectName("SourcesDetails")
         details_layout = QVBoxLayout(self._details_frame)
         details_layout.setContentsMargins(spacing.sm, spacing.sm, spacing.sm, spacing.sm)
         details_layout.setSpacing(spacing.xs)
 
         self._detail_status = QLabel()
+        self._detail_status.setTextFormat(Qt.TextFormat.RichText)
 
         # Now Playing section with album art (vertical: art above text)
         self._now_playing_frame = QWidget()
@@ -191,18 +398,16 @@ class SourcesPanel(QWidget):
         # Album art — fills panel width, height adjusts to keep aspect ratio
         self._album_art = QLabel()
         self._album_art.setMinimumHeight(ALBUM_ART_SIZE)
-        self._album_art.setScaledContents(True)
-        self._album_art.setStyleSheet(f"""
-            QLabel {{
-                background-color: {p.background};
-                border-radius: {sizing.border_radius_md}px;
-            }}
-        """)
+        # Left unscaled: _update_art_height pre-scales once per size, whereas
+        # setScaledContents would resample the pixmap on every paint
+        self._album_art.setStyleSheet(_art_background_style(p.background))
         self._original_pixmap: QPixmap | None = None
+        self._placeholder_shown = False
         now_playing_layout.addWidget(self._album_art)
 
         # Text info (title, artist, album)
         self._detail_now_playing = QLabel()
+        self._detail_now_playing.setTextFormat(Qt.TextFormat.RichText)
         self._detail_now_playing.setWordWrap(True)
         self._detail_now_playing.setStyleSheet(f"color: {p.text}; font-size: {typography.body}pt;")
         self._detail_now_playing.setAlignment(
@@ -224,17 +429,7 @@ class SourcesPanel(QWidget):
         self._progress_bar.setValue(0)
         self._progress_bar.setTextVisible(False)
         self._progress_bar.setFixedHeight(4)
-        self._progress_bar.setStyleSheet(f"""
-            QProgressBar {{
-                background-color: {p.surface_dim};
-                border: none;
-                border-radius: 2px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {p.accent};
-                border-radius: 2px;
-            }}
-        """)
+        self._progress_bar.setObjectName("SourcesProgress")
         self._progress_bar.setVisible(False)
         now_playing_layout.addWidget(self._progress_bar)
 
@@ -257,7 +452,7 @@ class SourcesPanel(QWidget):
         Args:
             item: The clicked list item.
         """
-        source_id = item.data(Qt.ItemDataRole.UserRole)
+        source_id = item.data(_SOURCE_ID_ROLE)
         if source_id:
             self.source_selected.emit(source_id)
 
@@ -269,7 +464,7 @@ class SourcesPanel(QWidget):
             self._details_frame.setVisible(False)
             return
 
-        source_id = current.data(Qt.ItemDataRole.UserRole)
+        source_id = current.data(_SOURCE_ID_ROLE)
         source = self._get_source_by_id(source_id)
         if source:
             self._update_details(source)
@@ -278,11 +473,8 @@ class SourcesPanel(QWidget):
             self._details_frame.setVisible(False)
 
     def _get_source_by_id(self, source_id: str) -> Source | None:
-        """Get source by ID from cached list."""
-        for source in self._sources:
-            if source.id == source_id:
-                return source
-        return None
+        """Get source by ID from the cached index."""
+        return self._sources_by_id.get(source_id)
 
     def set_server_host(self, host: str) -> None:
         """Set the server host for URL rewriting.
@@ -297,18 +489,16 @@ class SourcesPanel(QWidget):
 
     def _show_album_art_placeholder(self) -> None:
         """Show the 'No Art' placeholder for album art."""
+        # Misses and failed fetches repeat on every update; skip the
+        # stylesheet re-parse and relayout when nothing would change
+        if self._placeholder_shown:
+            return
+        self._placeholder_shown = True
         self._original_pixmap = None
         p = theme_manager.palette
         self._album_art.clear()
-        self._album_art.setScaledContents(False)  # Don't stretch text
         self._album_art.setFixedHeight(ALBUM_ART_SIZE)
-        self._album_art.setStyleSheet(f"""
-            QLabel {{
-                background-color: {p.background};
-                border-radius: {sizing.border_radius_md}px;
-                color: {p.text_disabled};
-            }}
-        """)
+        _set_style(self._album_art, _art_placeholder_style(p.background, p.text_disabled))
         self._album_art.setText("No\nArt")
         self._album_art.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
@@ -322,6 +512,7 @@ class SourcesPanel(QWidget):
             pixmap: Full-resolution pixmap to display.
         """
         logger.info("_set_pixmap: %dx%d", pixmap.width(), pixmap.height())
+        self._placeholder_shown = False
         # Scale down large images to save memory (UI only needs ~300px display)
         max_size = self._MAX_STORED_PIXMAP_SIZE
         if pixmap.width() > max_size or pixmap.height() > max_size:
@@ -332,14 +523,8 @@ class SourcesPanel(QWidget):
                 Qt.TransformationMode.SmoothTransformation,
             )
         self._original_pixmap = pixmap
-        # Don't use setScaledContents - it stretches without keeping aspect ratio
-        self._album_art.setScaledContents(False)
         self._album_art.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._album_art.setStyleSheet(f"""
-            QLabel {{
-                border-radius: {sizing.border_radius_md}px;
-            }}
-        """)
+        _set_style(self._album_art, _ART_PIXMAP_STYLE)
         # Defer display so layout has assigned the label's width
         QTimer.singleShot(10, self._update_art_height)
 
@@ -368,7 +553,8 @@ class SourcesPanel(QWidget):
         # SmoothTransformation on every resize event when size hasn't meaningfully changed)
         current = self._album_art.pixmap()
         if not current.isNull():
-            cw, ch = current.width(), current.height()
+            size = current.deviceIndependentSize()
+            cw, ch = size.width(), size.height()
             # Check dimensions are valid, close to target, AND aspect ratio matches original
             # (aspect ratio check prevents skipping when new art with different ratio arrives)
             if cw > 0 and ch > 0:
@@ -381,13 +567,16 @@ class SourcesPanel(QWidget):
                     and abs(ch - h) <= _SCALE_TOLERANCE_PX
                 ):
                     return
-        # Scale pixmap to fit label size while keeping aspect ratio
+        # Scale pixmap to fit label size while keeping aspect ratio, at device
+        # resolution so HiDPI screens paint it 1:1 instead of upscaling
+        dpr = self._album_art.devicePixelRatioF()
         scaled = self._original_pixmap.scaled(
-            w,
-            h,
+            round(w * dpr),
+            round(h * dpr),
             Qt.AspectRatioMode.KeepAspectRatio,
             Qt.TransformationMode.SmoothTransformation,
         )
+        scaled.setDevicePixelRatio(dpr)
         self._album_art.setPixmap(scaled)
 
     def event(self, ev: QEvent) -> bool:
@@ -410,40 +599,61 @@ class SourcesPanel(QWidget):
         if self._art_loaded:
             return
 
+        cache_key = f"{self._current_artist}|{self._current_album}|{self._current_title}"
+        if self._show_cached_art(cache_key):
+            return
+
         # Increment generation to invalidate any pending fallback requests
         self._fallback_generation += 1
         current_generation = self._fallback_generation
+        self._pending_art_key = cache_key
 
         # Show placeholder while fetching
         self._show_album_art_placeholder()
 
-        # Capture current metadata for the async call
-        artist = self._current_artist
-        album = self._current_album
-        title = self._current_title
+        # Stop a superseded fetch, then run this one on the shared art loop
+        if self._fallback_future is not None:
+            self._fallback_future.cancel()
+        self._fallback_future = asyncio.run_coroutine_threadsafe(
+            self._fetch_fallback_art(
+                self._current_artist,
+                self._current_album,
+                self._current_title,
+                current_generation,
+            ),
+            _fallback_art_loop(),
+        )
 
-        def fetch_in_thread() -> None:
-            """Run async fetch in background thread."""
-            loop = asyncio.new_event_loop()
-            try:
-                art = loop.run_until_complete(self._art_provider.fetch(artist, album, title))
-                if art and art.is_valid:
-                    # Store result with generation and signal main thread for UI update.
-                    # IMPORTANT: Use signal (not QTimer.singleShot) because this runs
-                    # in a plain Python thread — QTimer from non-Qt threads is undefined
-                    # behavior and can cause SIGSEGV during event delivery.
-                    with self._fallback_lock:
-                        self._pending_fallback_art = (art.data, art.mime_type, art.source)
-                        self._pending_fallback_generation = current_generation
-                    self._fallback_art_ready.emit()
-            except Exception as e:  # noqa: BLE001
-                logger.warning("Fallback album art failed: %s", e)
-            finally:
-                loop.close()
-
-        # Start background thread
-        thread = threading.Thread(target=fetch_in_thread, daemon=True)
-        thread.start()
+    async def _fetch_fallback_art(
+        self, artist: str, album: str, title: str, generation: int
+    ) -> None:
+        """Fetch fallback art on the art loop thread and hand it to the UI.
+
+        Args:
+            artist: Track artist.
+            album: Track album.
+            title: Track title.
+            generation: Fallback generation the result belongs to.
+        """
+        try:
+            art = await self._art_provider.fetch(artist, album, title)
+            image = None
+            if art and art.is_valid:
+                # Decode on an executor thread; the GUI only wraps the result
+                image = await asyncio.get_running_loop().run_in_executor(
+                    None, _load_scaled_image, art.data, self._MAX_STORED_PIXMAP_SIZE
+                )
+            if art and image is not None:
+                # Store result with generation and signal main thread for UI update.
+                # IMPORTANT: Use signal (not QTimer.singleShot) because this runs
+                # in a plain Python thread — QTimer from non-Qt threads is undefined
+                # behavior and can cause SIGSEGV during event delivery.
+                with self._fallback_lock:
+                    self._pending_fallback_art = (image, art.mime_type, art.source)
+                    self._pending_fallback_generation = generation
+                self._fallback_art_ready.emit()
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Fallback album art failed: %s", e)
 
     @Slot()
     def _apply_fallback_art(self) -> None:
@@ -471,17 +681,41 @@ class SourcesPanel(QWidget):
             logger.debug("Skipping fallback art - valid art already loaded")
             return
 
-        data, _mime_type, source = pending_art
+        image, _mime_type, source = pending_art
+
+        pixmap = QPixmap.fromImage(image)
+        self._set_pixmap(pixmap)
+        self._cache_art(self._pending_art_key, pixmap)
+        logger.info(
+            "Album art from %s for %s - %s",
+            source,
+            self._current_artist,
+            self._current_album or self._current_title,
+        )
+
+    def _show_cached_art(self, key: str) -> bool:
+        """Display cached art for key, cancelling any in-flight load.
+
+        Args:
+            key: Art URL or track metadata key.
 
-        pixmap = QPixmap()
-        if pixmap.loadFromData(data):
+        Returns:
+            True if the art was cached and is now displayed.
+        """
+        pixmap = QPixmapCache.find(_ART_CACHE_PREFIX + key)
+        if pixmap is None:
+            return False
+        # Invalidate pending decodes/fetches so they cannot overwrite the hit
+        self._fallback_generation += 1
+        self._cancel_http_art()
+        current = self._original_pixmap
+        if current is None or current.cacheKey() != pixmap.cacheKey():
             self._set_pixmap(pixmap)
-            logger.info(
-                "Album art from %s for %s - %s",
-                source,
-                self._current_artist,
-                self._current_album or self._current_title,
-            )
+        return True
+
+    def _cache_art(self, key: str, pixmap: QPixmap) -> None:
+        """Store decoded art in the shared pixmap cache; Qt evicts by size."""
+        QPixmapCache.insert(_ART_CACHE_PREFIX + key, pixmap)
 
     def _set_album_art(self, art_url: str) -> None:
         """Set the album art image.
@@ -490,6 +724,22 @@ class SourcesPanel(QWidget):
             art_url: Album art URL (data URI or http URL).
         """
         logger.debug("_set_album_art called with: %s", art_url[:80] if art_url else "None")
+        if art_url.startswith("data:"):
+            # Status pushes repeat the same payload; it is already shown or
+            # still decoding, so don't hash or decode it again
+            if art_url == self._last_art_url:
+                return
+        else:
+            self._last_art_url = ""
+
+        # Handle HTTP/HTTPS URLs
+        if art_url.startswith(_HTTP_PREFIXES):
+            self._fetch_http_art(art_url)
+            return
+
+        # Only an HTTP URL keeps an in-flight HTTP request relevant
+        self._cancel_http_art()
+
         if not art_url:
             # No URL from source, try fallback providers
             self._try_fallback_art()
@@ -499,20 +749,49 @@ class SourcesPanel(QWidget):
         if art_url.startswith("data:"):
             logger.debug("Loading data URI (gen=%d)", self._fallback_generation)
             if self._load_data_uri_image(art_url):
+                self._last_art_url = art_url
                 return
             # Data URI failed, try fallback
             self._try_fallback_art()
             return
 
-        # Handle HTTP/HTTPS URLs
-        if art_url.startswith(("http://", "https://")):
-            self._fetch_http_art(art_url)
-            return
-
         # Unknown URL scheme, try fallback
         logger.debug("Unsupported album art URL scheme: %s", art_url[:50])
         self._try_fallback_art()
 
+    def _rewrite_art_url(self, url: str) -> str:
+        """Point a local album art URL at the connected server host.
+
+        Rewrites the hostname only for local/loopback addresses
+        (e.g., http://localhost:1780/... → http://192.168.1.100:1780/...);
+        external URLs (coverartarchive.org, etc.) are returned unchanged.
+
+        Args:
+            url: HTTP/HTTPS album art URL.
+
+        Returns:
+            The URL to fetch.
+        """
+        # Plain host[:port] authorities (what Snapcast sends) are sliced in
+        # place; userinfo, IPv6 literals and odd ports go through urllib
+        match = _ART_URL_AUTHORITY_RE.match(url)
+        if match:
+            scheme, netloc = match.groups()
+            hostname, _, port_text = netloc.partition(":")
+            if "@" not in netloc and "[" not in netloc and (not port_text or port_text.isdigit()):
+                hostname = hostname.lower()
+                if hostname == self._server_host or not self._is_private_ip(hostname):
+                    return url
+                port = int(port_text or 0) or (443 if scheme == "https" else 80)
+                return f"{scheme}://{self._server_host}:{port}{url[match.end() :]}"
+
+        parsed = urlparse(url)
+        hostname = parsed.hostname or ""
+        if hostname == self._server_host or not self._is_private_ip(hostname):
+            return url
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        return urlunparse(parsed._replace(netloc=f"{self._server_host}:{port}"))
+
     def _is_private_ip(self, hostname: str) -> bool:
         """Check if hostname is a private/local IP address.
 
@@ -539,25 +818,23 @@ class SourcesPanel(QWidget):
         Args:
             url: HTTP/HTTPS URL to fetch.
         """
-        # Rewrite URL hostname only for local/loopback addresses
-        # (e.g., http://localhost:1780/... → http://192.168.1.100:1780/...)
-        # External URLs (coverartarchive.org, etc.) should not be rewritten
         if self._server_host:
-            parsed = urlparse(url)
-            hostname = parsed.hostname or ""
-            is_local = self._is_private_ip(hostname)
-            if is_local and hostname != self._server_host:
-                port = parsed.port or (443 if parsed.scheme == "https" else 80)
-                new_netloc = f"{self._server_host}:{port}"
-                url = urlunparse(parsed._replace(netloc=new_netloc))
+            url = self._rewrite_art_url(url)
+
+        if self._show_cached_art(url):
+            self._art_loaded = True
+            return
 
         # Skip if already fetching this URL
         if url == self._pending_art_url:
             return
 
+        # Stop downloading art for a source that is no longer shown
+        self._cancel_http_art()
         self._pending_art_url = url
         request = QNetworkRequest(QUrl(url))
         request.setHeader(QNetworkRequest.KnownHeaders.UserAgentHeader, "SnapCTRL/1.0")
+        request.setRawHeader(b"Accept", _art_accept_header())
         # Follow redirects (coverartarchive.org returns 307 redirects)
         request.setAttribute(
             QNetworkRequest.Attribute.RedirectPolicyAttribute,
@@ -565,31 +842,81 @@ class SourcesPanel(QWidget):
         )
         # Set timeout to prevent indefinite hanging
         request.setTransferTimeout(_NETWORK_TIMEOUT_MS)
-        self._network_manager.get(request)
+        # Covers rarely change, so a stored copy beats a revalidation trip
+        request.setAttribute(
+            QNetworkRequest.Attribute.CacheLoadControlAttribute,
+            QNetworkRequest.CacheLoadControl.PreferCache,
+        )
+        request.setAttribute(QNetworkRequest.Attribute.User, self._reply_tag)
+        reply = self._network_manager.get(request)
+        reply.downloadProgress.connect(partial(self._on_http_art_progress, reply))
+        self._current_reply = reply
         logger.debug("Fetching album art from: %s", url)
 
+    def _on_http_art_progress(self, reply: QNetworkReply, received: int, total: int) -> None:
+        """Abort an art download once it is known to exceed MAX_HTTP_ART_SIZE.
+
+        Args:
+            reply: The reply reporting progress.
+            received: Bytes received so far.
+            total: Content-Length, or -1 when the server did not send one.
+        """
+        if reply is not self._current_reply or max(received, total) <= MAX_HTTP_ART_SIZE:
+            return
+        logger.warning(
+            "Album art too large (%d bytes), aborting %s",
+            max(received, total),
+            self._pending_art_url,
+        )
+        # Cancelling first makes the aborted reply's finished signal stale,
+        # so the partial body is never decoded
+        self._cancel_http_art()
+        self._try_fallback_art()
+
+    def _cancel_http_art(self) -> None:
+        """Abort the in-flight HTTP album art request, if any."""
+        # Clear the pending URL first so the reply's synchronous finished
+        # signal from abort() is ignored as stale
+        self._pending_art_url = ""
+        reply, self._current_reply = self._current_reply, None
+        if reply is not None:
+            reply.abort()
+
+    @Slot(QNetworkReply)
+    def _on_network_reply(self, reply: QNetworkReply) -> None:
+        """Route finished replies from the shared manager to this panel's handler.
+
+        Args:
+            reply: A finished reply, possibly requested by another panel.
+        """
+        if reply.request().attribute(QNetworkRequest.Attribute.User) == self._reply_tag:
+            self._on_http_art_finished(reply)
+
     def _on_http_art_finished(self, reply: QNetworkReply) -> None:
         """Handle completed HTTP album art request.
 
         Args:
             reply: The network reply containing image data.
         """
-        url = reply.url().toString()
+        # Match the reply by identity, not by reply.url(): after a redirect
+        # that is the final location rather than the URL that was requested
+        if reply is not self._current_reply:
+            reply.deleteLater()
+            return
+        self._current_reply = None
+        url = self._pending_art_url
 
         # Read data even if there was an error (Snapcast has buggy Content-Length)
         image_data = reply.readAll().data()
         error = reply.error()
         reply.deleteLater()
 
-        # Only process if this is still the current request
-        if url != self._pending_art_url:
-            return
-
         # Try to load whatever data we got (Snapcast sends incomplete responses)
         if image_data:
-            pixmap = QPixmap()
-            if pixmap.loadFromData(image_data):
+            pixmap = _load_scaled_pixmap(image_data, self._MAX_STORED_PIXMAP_SIZE)
+            if pixmap is not None:
                 self._set_pixmap(pixmap)
+                self._cache_art(url, pixmap)
                 self._pending_art_url = ""
                 # Mark art as loaded to prevent fallback overwriting
                 self._art_loaded = True
@@ -613,43 +940,66 @@ class SourcesPanel(QWidget):
         Returns:
             True if decode started (async), False if invalid format.
         """
-        try:
-            # Parse data URI: data:mime_type;base64,<data>
-            _header, data_b64 = art_url.split(",", 1)
-
-            # Check size limit to prevent memory exhaustion
-            if len(data_b64) > MAX_ALBUM_ART_B64_SIZE:
-                logger.warning("Album art too large (%d bytes), skipping", len(data_b64))
-                return False
-
-            # Increment generation to invalidate stale requests
-            self._fallback_generation += 1
-            current_generation = self._fallback_generation
-
-            def decode_in_thread() -> None:
-                """Decode base64 in background thread to avoid UI blocking."""
-                try:
-                    image_data = base64.b64decode(data_b64)
-                    # Store result and signal main thread to apply
-                    with self._fallback_lock:
-                        self._pending_fallback_art = (image_data, "image/jpeg", "data-uri")
-                        self._pending_fallback_generation = current_generation
-                    # Emit signal to trigger UI update on main thread
-                    self._art_decoded.emit()
-                except (ValueError, binascii.Error) as e:
-                    logger.debug("Invalid album art data URI format: %s", e)
-                except MemoryError:
-                    logger.error("Out of memory loading album art")
-
-            # Start background thread for decode
-            thread = threading.Thread(target=decode_in_thread, daemon=True)
-            thread.start()
+        # Parse data URI: data:mime_type;base64,<data>. Locate the payload
+        # without slicing it, so oversized art is rejected before any
+        # payload-sized copy is made on the UI thread. The search is bounded
+        # so a malformed URI without a separator isn't scanned end to end.
+        header_end = art_url.find(",", 0, _DATA_URI_HEADER_MAX)
+        if header_end < 0:
+            logger.debug("Invalid album art data URI format: missing ','")
+            return False
+
+        # Check size limit to prevent memory exhaustion
+        b64_size = len(art_url) - header_end - 1
+        if b64_size > MAX_ALBUM_ART_B64_SIZE:
+            logger.warning("Album art too large (%d bytes), skipping", b64_size)
+            return False
+
+        # Key by length and string hash rather than the URI itself, so the
+        # cache never pins multi-megabyte payloads
+        cache_key = f"data:{len(art_url)}:{hash(art_url):x}"
+        if self._show_cached_art(cache_key):
+            self._art_loaded = True
             return True
 
-        except ValueError as e:
-            logger.debug("Invalid album art data URI format: %s", e)
+        # Increment generation to invalidate stale requests
+        self._fallback_generation += 1
+        current_generation = self._fallback_generation
+        self._pending_art_key = cache_key
 
-        return False
+        def decode_in_thread() -> None:
+            """Decode base64 in background thread to avoid UI blocking."""
+            try:
+                # Slice and encode here as well as decode, keeping every
+                # payload-sized copy off the UI thread. Qt's C++ decoder sizes
+                # its output once from the input length.
+                image_data = QByteArray.fromBase64(art_url[header_end + 1 :].encode("ascii"))
+                if image_data.isEmpty():
+                    # Qt yields an empty array rather than raising on bad input
+                    logger.debug("Invalid album art data URI: empty base64 payload")
+                    return
+                # Decode and scale here too; the GUI thread only wraps the image
+                image = _load_scaled_image(image_data, self._MAX_STORED_PIXMAP_SIZE)
+                if image is None:
+                    logger.warning(
+                        "Failed to decode album art from data URI (%d bytes)", len(image_data)
+                    )
+                    return
+                # Store result and signal main thread to apply
+                with self._fallback_lock:
+                    self._pending_fallback_art = (image, "image/jpeg", "data-uri")
+                    self._pending_fallback_generation = current_generation
+                # Emit signal to trigger UI update on main thread
+                self._art_decoded.emit()
+            except ValueError as e:
+                logger.debug("Invalid album art data URI format: %s", e)
+            except MemoryError:
+                logger.error("Out of memory loading album art")
+
+        # Start background thread for decode
+        thread = threading.Thread(target=decode_in_thread, daemon=True)
+        thread.start()
+        return True
 
     def _apply_data_uri_art(self) -> None:
         """Apply decoded data URI art to UI (called on main thread)."""
@@ -673,28 +1023,33 @@ class SourcesPanel(QWidget):
             logger.debug("Skipping stale art request")
             return
 
-        data, _mime_type, _source = pending_art
+        image, _mime_type, _source = pending_art
 
-        pixmap = QPixmap()
-        if pixmap.loadFromData(data):
-            self._set_pixmap(pixmap)
-            self._art_loaded = True
-            logger.info("Loaded album art from data URI (%d bytes)", len(data))
-        else:
-            logger.warning("Failed to load pixmap from data URI (%d bytes)", len(data))
+        pixmap = QPixmap.fromImage(image)
+        self._set_pixmap(pixmap)
+        self._cache_art(self._pending_art_key, pixmap)
+        self._art_loaded = True
+        logger.info("Loaded album art from data URI (%dx%d)", image.width(), image.height())
 
     def _update_details(self, source: Source) -> None:
         """Update the details panel with source info."""
+        # Coalesce the label updates below into a single repaint of the frame
+        self._details_frame.setUpdatesEnabled(False)
+        try:
+            self._apply_details(source)
+        finally:
+            self._details_frame.setUpdatesEnabled(True)
+
+    def _apply_details(self, source: Source) -> None:
+        """Write source info into the detail labels, skipping unchanged values."""
         # Status with color
         p = theme_manager.palette
         status = source.status.capitalize()
         if source.is_playing:
-            self._detail_status.setText(
-                f"Status: <span style='color: {p.success};'>{status}</span>"
-            )
+            status_text = f"Status: <span style='color: {p.success};'>{status}</span>"
         else:
-            self._detail_status.setText(f"Status: {status}")
-        self._detail_status.setTextFormat(Qt.TextFormat.RichText)
+            status_text = f"Status: {status}"
+        _set_label_text(self._detail_status, status_text)
 
         # Now Playing (track metadata with album art)
         if source.has_metadata:
@@ -703,47 +1058,41 @@ class SourcesPanel(QWidget):
             self._current_album = source.meta_album
             self._current_title = source.meta_title
 
-            # Show title on first line, artist/album on second if available
-            if source.meta_album:
-                self._detail_now_playing.setText(
-                    f"<b style='color: {p.text};'>{source.meta_title}</b><br/>"
-                    f"<span style='color: {p.text_secondary};'>{source.meta_artist}</span><br/>"
-                    f"<span style='color: {p.text_disabled}; font-style: italic;'>"
-                    f"{source.meta_album}</span>"
-                )
-            else:
-                self._detail_now_playing.setText(
-                    f"<b style='color: {p.text};'>{source.meta_title}</b><br/>"
-                    f"<span style='color: {p.text_secondary};'>{source.meta_artist}</span>"
-                )
-            self._detail_now_playing.setTextFormat(Qt.TextFormat.RichText)
+            # Show title on first line, artist/album below if available
+            now_playing = _now_playing_html(
+                source.meta_title,
+                source.meta_artist,
+                source.meta_album,
+                text=p.text,
+                secondary=p.text_secondary,
+                disabled=p.text_disabled,
+            )
+            _set_label_text(self._detail_now_playing, now_playing)
 
             # Update album art (will use fallback if no URL or HTTP fails)
             self._set_album_art(source.meta_art_url)
 
-            self._now_playing_frame.setVisible(True)
+            _set_shown(self._now_playing_frame, True)
         else:
             # Clear stored metadata
             self._current_artist = ""
             self._current_album = ""
             self._current_title = ""
-            self._now_playing_frame.setVisible(False)
+            _set_shown(self._now_playing_frame, False)
 
         # Type (scheme)
         scheme = source.uri_scheme or source.stream_type or "unknown"
-        self._detail_type.setText(f"Type: {scheme}")
+        _set_label_text(self._detail_type, f"Type: {scheme}")
 
         # Codec
         codec = source.display_codec
-        self._detail_codec.setText(f"Codec: {codec}")
+        _set_label_text(self._detail_codec, f"Codec: {codec}")
 
         # Sample format
         fmt = source.display_format
         if fmt:
-            self._detail_format.setText(f"Format: {fmt}")
-            self._detail_format.setVisible(True)
-        else:
-            self._detail_format.setVisible(False)
+            _set_label_text(self._detail_format, f"Format: {fmt}")
+        _set_shown(self._detail_format, bool(fmt))
 
     @staticmethod
     def _format_time(seconds: float) -> str:
@@ -774,47 +1123,94 @@ class SourcesPanel(QWidget):
             self._progress_bar.setValue(pct)
 
     def set_sources(self, sources: list[Source]) -> None:
-        """Update the list of sources.
+        """Update the list of sources using differential updates.
+
+        Rows are matched by source ID: existing items are updated in place,
+        and only new or removed sources add or take rows.
 
         Args:
             sources: List of Source objects to display.
         """
         # Cache sources for details lookup
         self._sources = sources
+        self._sources_by_id = {s.id: s for s in sources}
 
         # Remember current selection
         current_id = self.get_selected_source_id()
+        new_ids = self._sources_by_id.keys()
 
-        self._list.clear()
-
-        selected_item = None
-        for source in sources:
-            # Create item with icon indicator for playing status
-            status_icon = "▶ " if source.is_playing else "  "
-            item = QListWidgetItem(f"{status_icon}{source.name}")
-            item.setData(Qt.ItemDataRole.UserRole, source.id)
-
-            if source.is_playing:
-                item.setForeground(Qt.GlobalColor.green)
+        # Update with painting and selection signals suspended so the list
+        # repaints once, instead of once per changed row
+        self._list.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self._list):
+                # Remove rows for sources that no longer exist
+                for source_id in self._items_by_id.keys() - new_ids:
+                    item = self._items_by_id.pop(source_id)
+                    self._list.takeItem(self._list.row(item))
+
+                sync_item = self._sync_source_item
+                for row, source in enumerate(sources):
+                    sync_item(row, source)
+
+                # Restore selection (moved rows lose it, removed rows must not
+                # leave Qt's fallback neighbour selected)
+                selected_item = self._items_by_id.get(current_id) if current_id else None
+                if selected_item is None:
+                    self._list.setCurrentRow(-1)
+                elif self._list.currentItem() is not selected_item:
+                    self._list.setCurrentItem(selected_item)
+        finally:
+            self._list.setUpdatesEnabled(True)
+            self._list.viewport().update()
+
+        # Refresh details: the blocked currentItemChanged never reached
+        # _on_selection_changed, so mirror what it would have done
+        if not selected_item:
+            self._details_frame.setVisible(False)
+        # Force refresh details in case source data changed (e.g., art_url updated)
+        elif current_id:
+            source = self._get_source_by_id(current_id)
+            if source:
+                self._update_details(source)
 
-            self._list.addItem(item)
+    def _sync_source_item(self, row: int, source: Source) -> None:
+        """Create, move or update the list item for a source.
 
-            # Track previously selected item
-            if source.id == current_id:
-                selected_item = item
+        Args:
+            row: Target row of the source in the list.
+            source: Source the item represents.
+        """
+        # Item text carries an icon indicator for playing status
+        playing = source.is_playing
+        status_icon = "▶ " if playing else "  "
+        text = f"{status_icon}{source.name}"
+
+        item = self._items_by_id.get(source.id)
+        if item is None:
+            item = QListWidgetItem(text)
+            item.setData(_SOURCE_ID_ROLE, source.id)
+            self._list.insertItem(row, item)
+            self._items_by_id[source.id] = item
+        else:
+            # Rows before this one are already in order, so an existing
+            # item can only sit at or after its target row
+            current_row = self._list.row(item)
+            if current_row != row:
+                self._list.takeItem(current_row)
+                self._list.insertItem(row, item)
+            if item.text() == text:
+                return
+            item.setText(text)
 
-        # Restore selection and refresh details
-        if selected_item:
-            self._list.setCurrentItem(selected_item)
-            # Force refresh details in case source data changed (e.g., art_url updated)
-            if current_id:
-                source = self._get_source_by_id(current_id)
-                if source:
-                    self._update_details(source)
+        item.setData(_PLAYING_ROLE, playing)
 
     def clear_sources(self) -> None:
         """Clear all sources from the list."""
         self._list.clear()
+        self._items_by_id.clear()
+        self._sources = []
+        self._sources_by_id.clear()
 
     def get_selected_source_id(self) -> str | None:
         """Get the ID of the currently selected source.
@@ -824,7 +1220,7 @@ class SourcesPanel(QWidget):
         """
         item = self._list.currentItem()
         if item:
-            return item.data(Qt.ItemDataRole.UserRole)
+            return item.data(_SOURCE_ID_ROLE)
         return None
 
     def refresh_theme(self) -> None:
@@ -834,71 +1230,23 @@ class SourcesPanel(QWidget):
         self._header.setStyleSheet(
             f"font-weight: bold; font-size: {typography.title}pt; color: {p.text};"
         )
-        self._list.setStyleSheet(f"""
-            QListWidget {{
-                background-color: {p.surface_dim};
-                border: none;
-                padding: {spacing.xs}px;
-            }}
-            QListWidget::item {{
-                padding: {spacing.sm}px;
-                border-radius: {sizing.border_radius_md}px;
-            }}
-            QListWidget::item:selected {{
-                background-color: {p.surface_hover};
-            }}
-            QListWidget::item:hover {{
-                background-color: {p.surface_elevated};
-            }}
-        """)
-        self._details_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {p.surface_dim};
-                border-radius: {sizing.border_radius_md}px;
-                padding: {spacing.sm}px;
-            }}
-            QLabel {{
-                color: {p.text_secondary};
-                font-size: {typography.small}pt;
-            }}
-        """)
-        self._album_art.setStyleSheet(f"""
-            QLabel {{
-                background-color: {p.background};
-                border-radius: {sizing.border_radius_md}px;
-            }}
-        """)
+        self._album_art.setStyleSheet(_art_background_style(p.background))
+        # Let the next placeholder call restyle with the new palette
+        self._placeholder_shown = False
         self._detail_now_playing.setStyleSheet(f"color: {p.text}; font-size: {typography.body}pt;")
         self._time_label.setStyleSheet(
             f"color: {p.text_secondary}; font-size: {typography.body}pt;"
         )
-        self._progress_bar.setStyleSheet(f"""
-            QProgressBar {{
-                background-color: {p.surface_dim};
-                border: none;
-                border-radius: 2px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {p.accent};
-                border-radius: 2px;
-            }}
-        """)
 
         # Re-render now playing text with updated colors (HTML has embedded colors)
         if self._current_title:
-            if self._current_album:
-                self._detail_now_playing.setText(
-                    f"<b style='color: {p.text};'>{self._current_title}</b><br/>"
-                    f"<span style='color: {p.text_secondary};'>{self._current_artist}</span><br/>"
-                    f"<span style='color: {p.text_disabled}; font-style: italic;'>"
-                    f"{self._current_album}</span>"
-                )
-            elif self._current_artist:
-                self._detail_now_playing.setText(
-                    f"<b style='color: {p.text};'>{self._current_title}</b><br/>"
-                    f"<span style='color: {p.text_secondary};'>{self._current_artist}</span>"
-                )
-            else:
-                self._detail_now_playing.setText(
-                    f"<b style='color: {p.text};'>{self._current_title}</b>"
+            self._detail_now_playing.setText(
+                _now_playing_html(
+                    self._current_title,
+                    self._current_artist,
+                    self._current_album,
+                    text=p.text,
+                    secondary=p.text_secondary,
+                    disabled=p.text_disabled,
                 )
+            )
@@ -313,7 +313,7 @@ class SystemTrayManager(QObject):
         # Preferences and Quit
         self._menu.addSeparator()
         prefs_action = QAction("Preferences...", self._menu)
-        prefs_action.triggered.connect(self.preferences_requested.emit)
+        prefs_action.triggered.connect(self.preferences_requested)
         self._menu.addAction(prefs_action)
 
         quit_action = QAction("Quit", self._menu)
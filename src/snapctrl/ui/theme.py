@@ -225,7 +225,12 @@ class ThemeManager(QObject):
         self.apply_theme()
 
     def _global_stylesheet(self) -> str:
-        """Generate a global stylesheet for QApplication."""
+        """Generate a global stylesheet for QApplication.
+
+        The main window's base rules are scoped to it with an objectName
+        attribute selector, so they stay out of other top-level windows while
+        remaining less specific than the ``#ObjectName`` widget rules.
+        """
         p = self._palette
         return f"""
             QWidget {{
@@ -343,6 +348,81 @@ class ThemeManager(QObject):
             QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
                 width: 0px;
             }}
+            #SourcesList {{
+                background-color: {p.surface_dim};
+                border: none;
+                padding: {spacing.xs}px;
+            }}
+            #SourcesList::item {{
+                padding: {spacing.sm}px;
+                border-radius: {sizing.border_radius_md}px;
+            }}
+            #SourcesList::item:selected {{
+                background-color: {p.surface_hover};
+            }}
+            #SourcesList::item:hover {{
+                background-color: {p.surface_elevated};
+            }}
+            #SourcesDetails, #SourcesDetails QFrame {{
+                background-color: {p.surface_dim};
+                border-radius: {sizing.border_radius_md}px;
+                padding: {spacing.sm}px;
+            }}
+            #SourcesDetails QLabel {{
+                color: {p.text_secondary};
+                font-size: {typography.small}pt;
+            }}
+            #SourcesProgress {{
+                background-color: {p.surface_dim};
+                border: none;
+                border-radius: 2px;
+            }}
+            #SourcesProgress::chunk {{
+                background-color: {p.accent};
+                border-radius: 2px;
+            }}
+            #GroupCard {{
+                background-color: {p.surface_elevated};
+                border-radius: {sizing.border_radius_lg}px;
+                border: 1px solid {p.border};
+            }}
+            #GroupCard[selected="true"] {{
+                background-color: {p.surface_selected};
+                border: 2px solid {p.border_selected};
+            }}
+            #GroupCardName {{
+                font-weight: bold;
+                font-size: {typography.title}pt;
+                padding: {spacing.xs}px;
+                color: {p.text};
+            }}
+            #GroupCardExpand {{
+                border: none;
+            }}
+            #GroupCardSourceLabel {{
+                color: {p.text_disabled};
+            }}
+            #GroupCardClientsLabel {{
+                color: {p.text_disabled};
+                font-size: {typography.body}pt;
+            }}
+            #ClientCard {{
+                background-color: {p.surface_dim};
+                border-radius: {sizing.border_radius_lg}px;
+                border: 1px solid {p.border};
+            }}
+            #ClientCard[selected="true"] {{
+                background-color: {p.surface_selected};
+                border: 2px solid {p.border_selected};
+            }}
+            QMainWindow[objectName="MainWindow"] {{
+                background-color: {p.background};
+            }}
+            QMainWindow[objectName="MainWindow"] QWidget {{
+                background-color: {p.surface};
+                color: {p.text};
+                font-size: {typography.subtitle}pt;
+            }}
         """
 
 
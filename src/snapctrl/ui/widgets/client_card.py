@@ -3,7 +3,7 @@
 A compact widget for individual client control within a group card.
 """
 
-from PySide6.QtCore import QEvent, QObject, Signal
+from PySide6.QtCore import QEvent, QObject, Signal, Slot
 from PySide6.QtGui import QContextMenuEvent, QMouseEvent
 from PySide6.QtWidgets import (
     QFrame,
@@ -72,7 +72,11 @@ class ClientCard(QFrame):
         """
         self._selected = False
         self.setFrameShape(QFrame.Shape.StyledPanel)
-        self._update_style(False)
+        # Card frame styles live in the app-wide stylesheet, keyed on the
+        # object name and the "selected" property
+        self.setObjectName("ClientCard")
+        self.setProperty("selected", False)
+        self._setup_styles()
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(spacing.sm, spacing.sm, spacing.sm, spacing.sm)
@@ -82,17 +86,7 @@ class ClientCard(QFrame):
         # Use filled circle with different colors: green=connected, red=disconnected
         p = theme_manager.palette
         self._status_indicator = QLabel("●")
-        indicator_size = sizing.emoji_indicator
-        if self._connected:
-            self._status_indicator.setStyleSheet(
-                f"color: {p.success}; font-size: {indicator_size}px;"
-            )
-            self._status_indicator.setToolTip("Connected")
-        else:
-            self._status_indicator.setStyleSheet(
-                f"color: {p.error}; font-size: {indicator_size}px;"
-            )
-            self._status_indicator.setToolTip("Disconnected")
+        self._apply_connected_style()
         self._status_indicator.setCursor(self.cursor())
         self._status_indicator.installEventFilter(self)
         layout.addWidget(self._status_indicator)
@@ -116,6 +110,23 @@ class ClientCard(QFrame):
         self._volume_slider.mute_toggled.connect(self._on_mute_toggled)
         layout.addWidget(self._volume_slider)
 
+    def _setup_styles(self) -> None:
+        """Build the status indicator stylesheets once, so state changes only swap them."""
+        p = theme_manager.palette
+        indicator_size = sizing.emoji_indicator
+        self._connected_style = f"color: {p.success}; font-size: {indicator_size}px;"
+        self._disconnected_style = f"color: {p.error}; font-size: {indicator_size}px;"
+
+    def _apply_connected_style(self) -> None:
+        """Apply the status indicator style and tooltip for the connection state."""
+        if self._connected:
+            self._status_indicator.setStyleSheet(self._connected_style)
+            self._status_indicator.setToolTip("Connected")
+        else:
+            self._status_indicator.setStyleSheet(self._disconnected_style)
+            self._status_indicator.setToolTip("Disconnected")
+
+    @Slot(int)
     def _on_volume_changed(self, volume: int) -> None:
         """Handle volume change from slider.
 
@@ -124,6 +135,7 @@ class ClientCard(QFrame):
         """
         self.volume_changed.emit(self._client_id, volume)
 
+    @Slot(bool)
     def _on_mute_toggled(self, muted: bool) -> None:
         """Handle mute toggle from slider.
 
@@ -164,20 +176,12 @@ class ClientCard(QFrame):
         Args:
             connected: Whether the client is connected.
         """
+        # Every state update lands here; restyling re-parses the stylesheet
+        if connected == self._connected:
+            return
         self._connected = connected
         # Always use filled circle, change color: green=connected, red=disconnected
-        p = theme_manager.palette
-        indicator_size = sizing.emoji_indicator
-        if connected:
-            self._status_indicator.setStyleSheet(
-                f"color: {p.success}; font-size: {indicator_size}px;"
-            )
-            self._status_indicator.setToolTip("Connected")
-        else:
-            self._status_indicator.setStyleSheet(
-                f"color: {p.error}; font-size: {indicator_size}px;"
-            )
-            self._status_indicator.setToolTip("Disconnected")
+        self._apply_connected_style()
 
     def set_selected(self, selected: bool) -> None:
         """Set the visual selection state.
@@ -185,32 +189,15 @@ class ClientCard(QFrame):
         Args:
             selected: Whether this card is selected.
         """
+        # Selecting one client visits every card in the group; most keep their state
+        if selected == self._selected:
+            return
         self._selected = selected
-        self._update_style(selected)
-
-    def _update_style(self, selected: bool) -> None:
-        """Update the visual style based on selection state.
-
-        Args:
-            selected: Whether this card is selected.
-        """
-        p = theme_manager.palette
-        if selected:
-            self.setStyleSheet(f"""
-                ClientCard {{
-                    background-color: {p.surface_selected};
-                    border-radius: {sizing.border_radius_lg}px;
-                    border: 2px solid {p.border_selected};
-                }}
-            """)
-        else:
-            self.setStyleSheet(f"""
-                ClientCard {{
-                    background-color: {p.surface_dim};
-                    border-radius: {sizing.border_radius_lg}px;
-                    border: 1px solid {p.border};
-                }}
-            """)
+        # Re-polish to re-match the app stylesheet's [selected] rules
+        self.setProperty("selected", selected)
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
 
     def update_from_client(self, client: Client) -> None:
         """Update card from client data.
@@ -218,8 +205,9 @@ class ClientCard(QFrame):
         Args:
             client: The client with updated data.
         """
-        self._name = client.name
-        self._name_label.setText(client.name)
+        if client.name != self._name:
+            self._name = client.name
+            self._name_label.setText(client.name)
         self.set_volume(client.volume)
         self.set_muted(client.muted)
         self.set_connected(client.connected)
@@ -279,21 +267,13 @@ class ClientCard(QFrame):
     def refresh_theme(self) -> None:
         """Refresh styles when theme changes."""
         p = theme_manager.palette
-        # Re-apply card style based on selection state
-        self._update_style(self._selected)
+        # Rebuild styles for the new palette and re-apply based on current state
+        self._setup_styles()
         # Update name label
         self._name_label.setStyleSheet(
             f"font-size: {typography.body}pt; color: {p.text}; padding: {spacing.xs}px;"
         )
         # Update status indicator
-        indicator_size = sizing.emoji_indicator
-        if self._connected:
-            self._status_indicator.setStyleSheet(
-                f"color: {p.success}; font-size: {indicator_size}px;"
-            )
-        else:
-            self._status_indicator.setStyleSheet(
-                f"color: {p.error}; font-size: {indicator_size}px;"
-            )
+        self._apply_connected_style()
         # Refresh volume slider
         self._volume_slider.refresh_theme()
@@ -1,6 +1,8 @@
 """Group card widget - displays a group with volume control and source selection."""
 
-from PySide6.QtCore import QEvent, QObject, Signal
+from dataclasses import replace
+
+from PySide6.QtCore import QSignalBlocker, Qt, QTimer, Signal, Slot
 from PySide6.QtGui import QContextMenuEvent, QMouseEvent
 from PySide6.QtWidgets import (
     QComboBox,
@@ -15,11 +17,38 @@ from PySide6.QtWidgets import (
 from snapctrl.models.client import Client
 from snapctrl.models.group import Group
 from snapctrl.models.source import Source
-from snapctrl.ui.theme import theme_manager
-from snapctrl.ui.tokens import sizing, spacing, typography
+from snapctrl.ui.tokens import sizing, spacing
 from snapctrl.ui.widgets.client_card import ClientCard
 from snapctrl.ui.widgets.volume_slider import VolumeSlider
 
+# Minimum spacing of group volume emissions while the slider is dragged;
+# each emission fans out to one volume RPC per client in the group
+_VOLUME_EMIT_INTERVAL_MS = 64
+
+# Expand button glyphs for the collapsed/expanded client list
+_ARROW_COLLAPSED = "▼"
+_ARROW_EXPANDED = "▲"
+
+
+class _ClickableLabel(QLabel):
+    """Label that reports mouse presses through a signal.
+
+    Only mouse presses reach Python; an event filter would see every event
+    the label receives.
+    """
+
+    clicked = Signal()
+
+    # noinspection PyMethodOverriding
+    def mousePressEvent(self, event: QMouseEvent) -> None:  # noqa: N802
+        """Emit clicked and keep the press from reaching the parent card.
+
+        Args:
+            event: The mouse event.
+        """
+        event.accept()
+        self.clicked.emit()
+
 
 class GroupCard(QWidget):
     """Card widget for displaying and controlling a group.
@@ -59,10 +88,19 @@ class GroupCard(QWidget):
         super().__init__()
 
         self._group = group
+        # Kept alongside _group for the signal paths, which run per slider tick
+        self._group_id = group.id if group else ""
         self._sources: list[Source] = []
+        # (id, name) per combo entry; metadata-only source updates leave it equal
+        self._source_keys: tuple[tuple[str, str], ...] = ()
+        self._source_index: dict[str, int] = {}  # stream_id -> combo row
         self._expanded = False
         self._selected = False
         self._client_cards: dict[str, ClientCard] = {}
+        self._client_order: tuple[str, ...] = ()  # client IDs in layout order
+        # Latest clients received while collapsed; cards are built on expand
+        self._pending_clients: list[Client] | None = None
+        self._selected_client_id: str | None = None
 
         self._setup_ui()
 
@@ -71,7 +109,10 @@ class GroupCard(QWidget):
 
     def _setup_ui(self) -> None:
         """Set up the user interface."""
-        self._setup_styles()
+        # Card styles live in the app-wide stylesheet (theme_manager.apply_theme),
+        # keyed on object names, so cards don't each parse their own CSS
+        self.setObjectName("GroupCard")
+        self.setProperty("selected", False)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(spacing.md, spacing.sm, spacing.md, spacing.sm)
         layout.setSpacing(spacing.sm)
@@ -79,26 +120,8 @@ class GroupCard(QWidget):
         layout.addLayout(self._create_header())
         layout.addWidget(self._create_volume_slider())
         layout.addLayout(self._create_source_row())
-        layout.addWidget(self._create_client_list())
-
-    def _setup_styles(self) -> None:
-        """Set up widget styles."""
-        p = theme_manager.palette
-        self._base_style = f"""
-            GroupCard {{
-                background-color: {p.surface_elevated};
-                border-radius: {sizing.border_radius_lg}px;
-                border: 1px solid {p.border};
-            }}
-        """
-        self._selected_style = f"""
-            GroupCard {{
-                background-color: {p.surface_selected};
-                border-radius: {sizing.border_radius_lg}px;
-                border: 2px solid {p.border_selected};
-            }}
-        """
-        self.setStyleSheet(self._base_style)
+        # The client list is built on first expand; most groups stay collapsed
+        self._client_list: QWidget | None = None
 
     def _create_header(self) -> QHBoxLayout:
         """Create the header row with name and expand button.
@@ -109,21 +132,17 @@ class GroupCard(QWidget):
         header = QHBoxLayout()
         header.setSpacing(spacing.sm)
 
-        p = theme_manager.palette
-        self._name_label = QLabel("Group Name")
-        self._name_label.setStyleSheet(
-            f"font-weight: bold; font-size: {typography.title}pt;"
-            f" padding: {spacing.xs}px; color: {p.text};"
-        )
-        self._name_label.installEventFilter(self)
+        self._name_label = _ClickableLabel("Group Name")
+        self._name_label.setObjectName("GroupCardName")
+        self._name_label.clicked.connect(self.clicked)
         header.addWidget(self._name_label)
 
         header.addStretch()
 
-        self._expand_button = QPushButton("▼")
+        self._expand_button = QPushButton(_ARROW_COLLAPSED)
         self._expand_button.setFixedSize(sizing.icon_md, sizing.icon_md)
         self._expand_button.setFlat(True)
-        self._expand_button.setStyleSheet("QPushButton { border: none; }")
+        self._expand_button.setObjectName("GroupCardExpand")
         self._expand_button.clicked.connect(self._toggle_expand)
         header.addWidget(self._expand_button)
 
@@ -139,16 +158,43 @@ class GroupCard(QWidget):
         slider.volume_changed.connect(self._on_volume_slider_changed)
         slider.mute_toggled.connect(self._on_slider_mute_toggled)
         self._volume_slider = slider
+
+        self._pending_volume: int | None = None
+        self._volume_emit_timer = QTimer(self)
+        self._volume_emit_timer.setSingleShot(True)
+        self._volume_emit_timer.setInterval(_VOLUME_EMIT_INTERVAL_MS)
+        self._volume_emit_timer.timeout.connect(self._flush_pending_volume)
         return slider
 
+    @Slot(bool)
     def _on_slider_mute_toggled(self, muted: bool) -> None:
         """Handle mute toggle from the volume slider's speaker icon."""
-        self.mute_toggled.emit(self._group.id if self._group else "", muted)
+        self.mute_toggled.emit(self._group_id, muted)
 
+    @Slot(int)
     def _on_volume_slider_changed(self, vol: int) -> None:
-        """Handle volume slider value changes."""
-        group_id = self._group.id if self._group else ""
-        self.volume_changed.emit(group_id, vol)
+        """Handle volume slider value changes.
+
+        The first change is emitted at once; changes arriving within
+        _VOLUME_EMIT_INTERVAL_MS of an emission are coalesced, and the latest
+        is emitted when the interval ends.
+        """
+        if self._volume_emit_timer.isActive():
+            self._pending_volume = vol
+            return
+        self._emit_volume(vol)
+
+    @Slot()
+    def _flush_pending_volume(self) -> None:
+        """Emit the volume coalesced during the last interval, if any."""
+        vol, self._pending_volume = self._pending_volume, None
+        if vol is not None:
+            self._emit_volume(vol)
+
+    def _emit_volume(self, vol: int) -> None:
+        """Emit volume_changed and open a new coalescing interval."""
+        self.volume_changed.emit(self._group_id, vol)
+        self._volume_emit_timer.start()
 
     def _create_source_row(self) -> QHBoxLayout:
         """Create the source selection row.
@@ -159,19 +205,23 @@ class GroupCard(QWidget):
         source_row = QHBoxLayout()
         source_row.setSpacing(spacing.sm)
 
-        p = theme_manager.palette
         self._source_label = QLabel("Source:")
-        self._source_label.setStyleSheet(f"color: {p.text_disabled};")
+        self._source_label.setObjectName("GroupCardSourceLabel")
         source_row.addWidget(self._source_label)
 
         self._source_combo = QComboBox()
         self._source_combo.setMinimumWidth(120)
-        self._source_combo.currentTextChanged.connect(self._on_source_changed)
+        self._source_combo.currentIndexChanged.connect(self._on_source_changed)
         source_row.addWidget(self._source_combo)
 
         source_row.addStretch()
         return source_row
 
+    def _ensure_client_list(self) -> None:
+        """Append the client list to the card if it has not been built yet."""
+        if self._client_list is None:
+            self.layout().addWidget(self._create_client_list())
+
     def _create_client_list(self) -> QWidget:
         """Create the expandable client list widget.
 
@@ -185,9 +235,7 @@ class GroupCard(QWidget):
         client_layout.setSpacing(spacing.xs)
 
         self._client_list_label = QLabel("Clients:")
-        self._client_list_label.setStyleSheet(
-            f"color: {theme_manager.palette.text_disabled}; font-size: {typography.body}pt;"
-        )
+        self._client_list_label.setObjectName("GroupCardClientsLabel")
         client_layout.addWidget(self._client_list_label)
 
         self._clients_container = QWidget()
@@ -230,22 +278,7 @@ class GroupCard(QWidget):
             )
             new_name = new_name.strip()
             if ok and new_name and new_name != self._group.name:
-                self.rename_requested.emit(self._group.id, new_name)
-
-    def eventFilter(self, watched: QObject, event: QEvent) -> bool:  # noqa: N802
-        """Filter events from child widgets to handle clicks on name label.
-
-        Args:
-            watched: The object being watched.
-            event: The event.
-
-        Returns:
-            True if event was handled, False otherwise.
-        """
-        if event.type() == QEvent.Type.MouseButtonPress and watched is self._name_label:
-            self.clicked.emit()
-            return True
-        return super().eventFilter(watched, event)
+                self.rename_requested.emit(self._group_id, new_name)
 
     def _set_selected(self, selected: bool) -> None:
         """Internal: Set the visual selection state.
@@ -253,11 +286,16 @@ class GroupCard(QWidget):
         Args:
             selected: Whether this card is selected.
         """
+        # Panel selection visits every card; only the transitions need a restyle
+        if selected == self._selected:
+            return
         self._selected = selected
-        if selected:
-            self.setStyleSheet(self._selected_style)
-        else:
-            self.setStyleSheet(self._base_style)
+        # Re-polish to re-match the app stylesheet's [selected] rules; unlike
+        # setStyleSheet this reuses the already parsed sheet
+        self.setProperty("selected", selected)
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
 
     def set_selected(self, selected: bool) -> None:
         """Set the visual selection state (public API).
@@ -274,6 +312,7 @@ class GroupCard(QWidget):
             group: Group to display.
         """
         self._group = group
+        self._group_id = group.id
         self._update_from_group()
 
     def _update_from_group(self) -> None:
@@ -281,7 +320,10 @@ class GroupCard(QWidget):
         if not self._group:
             return
 
-        self._name_label.setText(self._group.name)
+        # Server state polls mostly repeat the name; skip the relayout then.
+        # The slider's set_muted already ignores unchanged states.
+        if self._name_label.text() != self._group.name:
+            self._name_label.setText(self._group.name)
 
         # Update volume slider mute state
         self._volume_slider.set_muted(self._group.muted)
@@ -293,32 +335,47 @@ class GroupCard(QWidget):
             sources: List of available sources.
         """
         self._sources = sources
+        combo = self._source_combo
 
         # Block signals to avoid triggering source_changed during initialization
-        self._source_combo.blockSignals(True)
-        self._source_combo.clear()
-        for source in sources:
-            self._source_combo.addItem(source.name, source.id)
-
-        # Select current source for this group
-        if self._group:
-            index = self._source_combo.findData(self._group.stream_id)
-            if index >= 0:
-                self._source_combo.setCurrentIndex(index)
-        self._source_combo.blockSignals(False)
-
-    def _on_source_changed(self, _text: str) -> None:
-        """Handle source dropdown change."""
-        stream_id = self._source_combo.currentData()
+        with QSignalBlocker(combo):
+            # Rebuild the combo model only when the entries it shows changed;
+            # track metadata updates replace the Source objects on every refresh
+            keys = tuple((source.id, source.name) for source in sources)
+            if keys != self._source_keys:
+                self._source_keys = keys
+                self._source_index = {source.id: row for row, source in enumerate(sources)}
+                # Repaint the combo once for the whole rebuild
+                combo.setUpdatesEnabled(False)
+                try:
+                    combo.clear()
+                    for source in sources:
+                        combo.addItem(source.name, source.id)
+                finally:
+                    combo.setUpdatesEnabled(True)
+
+            # Select current source for this group
+            if self._group:
+                index = self._source_index.get(self._group.stream_id, -1)
+                if index >= 0 and index != combo.currentIndex():
+                    combo.setCurrentIndex(index)
+
+    @Slot(int)
+    def _on_source_changed(self, index: int) -> None:
+        """Handle source dropdown change.
+
+        Args:
+            index: Newly selected combo row, or -1 when cleared.
+        """
+        stream_id = self._source_combo.itemData(index)
         if stream_id:
-            self.source_changed.emit(self._group.id if self._group else "", stream_id)
+            self.source_changed.emit(self._group_id, stream_id)
 
+    @Slot()
     def _toggle_expand(self) -> None:
         """Toggle expand/collapse of client list."""
-        self._expanded = not self._expanded
-        self._client_list.setVisible(self._expanded)
-        self._expand_button.setText("▲" if self._expanded else "▼")
-        self.expand_toggled.emit(self._group.id if self._group else "", self._expanded)
+        self._apply_expanded(not self._expanded)
+        self.expand_toggled.emit(self._group_id, self._expanded)
 
     @property
     def is_expanded(self) -> bool:
@@ -332,9 +389,20 @@ class GroupCard(QWidget):
             expanded: Whether the client list should be expanded.
         """
         if self._expanded != expanded:
-            self._expanded = expanded
+            self._apply_expanded(expanded)
+
+    def _apply_expanded(self, expanded: bool) -> None:
+        """Store the expanded state and sync the client list and arrow."""
+        self._expanded = expanded
+        if expanded:
+            self._ensure_client_list()
+            if self._pending_clients is not None:
+                # Build the cards before the list is shown so it lays out once
+                self._sync_client_cards(self._pending_clients)
+                self._pending_clients = None
+        if self._client_list is not None:
             self._client_list.setVisible(expanded)
-            self._expand_button.setText("▲" if expanded else "▼")
+        self._expand_button.setText(_ARROW_EXPANDED if expanded else _ARROW_COLLAPSED)
 
     def set_volume(self, volume: int) -> None:
         """Set the volume for this card.
@@ -358,11 +426,12 @@ class GroupCard(QWidget):
             clients: Optional list of clients for this group.
         """
         self._group = group
+        self._group_id = group.id
         self._update_from_group()
 
-        # Update sources if changed
-        if self._sources != sources:
-            self.set_sources(sources)
+        # Sync the dropdown; cheap when the entries are unchanged, and it
+        # follows stream changes made elsewhere
+        self.set_sources(sources)
 
         # Update client cards if provided
         if clients is not None:
@@ -373,34 +442,81 @@ class GroupCard(QWidget):
     def _update_client_cards(self, clients: list[Client]) -> None:
         """Internal: Update the client cards in the list.
 
+        While the group is collapsed the list is hidden, so the clients are
+        only kept until the next expand.
+
         Args:
             clients: List of clients in this group.
         """
-        # Clear existing client cards
-        for card in self._client_cards.values():
-            card.setParent(None)
-        self._client_cards.clear()
+        if not self._expanded:
+            self._pending_clients = clients
+            return
+        self._pending_clients = None
+        self._sync_client_cards(clients)
 
-        # Add new client cards
-        for client in clients:
-            card = ClientCard(
-                client_id=client.id,
-                name=client.name,
-                volume=client.volume,
-                muted=client.muted,
-                connected=client.connected,
-            )
-            # Forward client signals
-            card.volume_changed.connect(self.client_volume_changed.emit)
-            card.mute_toggled.connect(self.client_mute_toggled.emit)
-            card.clicked.connect(self.client_clicked.emit)
-            card.rename_requested.connect(self.client_rename_requested.emit)
+    def _sync_client_cards(self, clients: list[Client]) -> None:
+        """Internal: Diff the client cards against ``clients``.
 
-            self._client_cards[client.id] = card
-            self._clients_layout.addWidget(card)
+        Args:
+            clients: List of clients in this group.
+        """
+        count_text = f"Clients: ({len(clients)})"
+        if self._client_list_label.text() != count_text:
+            self._client_list_label.setText(count_text)
+
+        # Membership and order usually match the last update; then the cards
+        # only need refreshing in place
+        order = tuple(client.id for client in clients)
+        changed = order != self._client_order
+
+        # Suspend painting so adding, moving and removing cards repaints
+        # the list once rather than once per card
+        container = self._clients_container
+        container.setUpdatesEnabled(False)
+        try:
+            if not changed:
+                for client in clients:
+                    self._client_cards[client.id].update_from_client(client)
+            else:
+                self._reorder_client_cards(clients)
+        finally:
+            container.setUpdatesEnabled(True)
+        self._client_order = order
+
+    def _reorder_client_cards(self, clients: list[Client]) -> None:
+        """Internal: Rebuild the card rows for a changed client list.
+
+        Known cards are updated in place (keeping their selection) and moved
+        only when their row changed; cards are constructed only for new
+        clients.
 
-        # Update the client count label
-        self._client_list_label.setText(f"Clients: ({len(clients)})")
+        Args:
+            clients: List of clients in this group.
+        """
+        # Take over the cards of clients still present; whatever is left in
+        # the old dict belongs to clients that left the group
+        old = self._client_cards
+        self._client_cards = {}
+        reused = [old.pop(client.id, None) for client in clients]
+        for card in old.values():
+            card.setParent(None)
+            card.deleteLater()
+
+        layout = self._clients_layout
+        for row, (client, existing) in enumerate(zip(clients, reused, strict=True)):
+            if existing is None:
+                card = self._make_client_card(
+                    client.id, client.name, client.volume, client.muted, client.connected
+                )
+                layout.insertWidget(row, card)
+            else:
+                card = existing
+                card.update_from_client(client)
+                # Rows before this one are already in order
+                if layout.indexOf(card) != row:
+                    layout.removeWidget(card)
+                    layout.insertWidget(row, card)
+            self._client_cards[client.id] = card
 
     def _update_group_volume_from_clients(self, clients: list[Client]) -> None:
         """Update group volume slider to reflect average of connected clients.
@@ -408,13 +524,19 @@ class GroupCard(QWidget):
         Args:
             clients: List of clients in this group.
         """
-        # Calculate average volume of connected clients
-        connected_clients = [c for c in clients if c.connected]
-        if connected_clients:
-            avg_volume = sum(c.volume for c in connected_clients) // len(connected_clients)
+        # Calculate average volume of connected clients, totalling both
+        # averages in one pass over the clients
+        total = connected_total = connected_count = 0
+        for client in clients:
+            total += client.volume
+            if client.connected:
+                connected_total += client.volume
+                connected_count += 1
+        if connected_count:
+            avg_volume = connected_total // connected_count
         elif clients:
             # Fall back to all clients if none connected
-            avg_volume = sum(c.volume for c in clients) // len(clients)
+            avg_volume = total // len(clients)
         else:
             avg_volume = 50  # Default if no clients
 
@@ -438,6 +560,7 @@ class GroupCard(QWidget):
             client_id: The client ID.
             volume: New volume 0-100.
         """
+        self._update_pending_client(client_id, volume=volume)
         if client_id in self._client_cards:
             self._client_cards[client_id].set_volume(volume)
 
@@ -450,9 +573,21 @@ class GroupCard(QWidget):
         Args:
             volumes: Dict mapping client_id -> volume (0-100).
         """
-        for client_id, volume in volumes.items():
-            if client_id in self._client_cards:
-                self._client_cards[client_id].set_volume(volume)
+        if self._pending_clients is not None:
+            self._pending_clients = [
+                replace(client, volume=volumes[client.id]) if client.id in volumes else client
+                for client in self._pending_clients
+            ]
+        if self._client_list is None:
+            return
+        # Follow updates arrive per slider tick; repaint the cards together
+        self._clients_container.setUpdatesEnabled(False)
+        try:
+            for client_id, volume in volumes.items():
+                if client_id in self._client_cards:
+                    self._client_cards[client_id].set_volume(volume)
+        finally:
+            self._clients_container.setUpdatesEnabled(True)
 
     def set_selected_client(self, client_id: str | None) -> None:
         """Set which client is selected in this group.
@@ -460,8 +595,16 @@ class GroupCard(QWidget):
         Args:
             client_id: The client ID to select, or None to deselect all.
         """
-        for cid, card in self._client_cards.items():
-            card.set_selected(cid == client_id)
+        # Only the previously and newly selected cards can change
+        if client_id == self._selected_client_id:
+            return
+        previous = self._client_cards.get(self._selected_client_id or "")
+        if previous is not None:
+            previous.set_selected(False)
+        self._selected_client_id = client_id
+        card = self._client_cards.get(client_id or "")
+        if card is not None:
+            card.set_selected(True)
 
     def set_client_muted(self, client_id: str, muted: bool) -> None:
         """Update mute state for a specific client card.
@@ -470,9 +613,27 @@ class GroupCard(QWidget):
             client_id: The client ID.
             muted: New mute state.
         """
+        self._update_pending_client(client_id, muted=muted)
         if client_id in self._client_cards:
             self._client_cards[client_id].set_muted(muted)
 
+    def _update_pending_client(self, client_id: str, **changes: int | bool) -> None:
+        """Apply a client change to the snapshot kept while collapsed.
+
+        The snapshot is applied on the next expand, so it has to follow
+        changes made after it was taken or it would restore older values.
+
+        Args:
+            client_id: The client ID.
+            **changes: Client fields to replace.
+        """
+        if self._pending_clients is None:
+            return
+        self._pending_clients = [
+            replace(client, **changes) if client.id == client_id else client
+            for client in self._pending_clients
+        ]
+
     def set_mute_state(self, muted: bool) -> None:
         """Set the mute state without emitting signals (for external updates).
 
@@ -500,38 +661,55 @@ class GroupCard(QWidget):
             client_muted: Whether the client is muted.
             client_connected: Whether the client is connected.
         """
-        card = ClientCard(
-            client_id=client_id,
-            name=client_name,
-            volume=client_volume,
-            muted=client_muted,
-            connected=client_connected,
+        self._ensure_client_list()
+        card = self._make_client_card(
+            client_id, client_name, client_volume, client_muted, client_connected
         )
-        # Forward client signals
-        card.volume_changed.connect(self.client_volume_changed.emit)
-        card.mute_toggled.connect(self.client_mute_toggled.emit)
-        card.clicked.connect(self.client_clicked.emit)
-        card.rename_requested.connect(self.client_rename_requested.emit)
-
         self._client_cards[client_id] = card
+        self._client_order += (client_id,)
         self._clients_layout.addWidget(card)
 
+    def _make_client_card(
+        self, client_id: str, name: str, volume: int, muted: bool, connected: bool
+    ) -> ClientCard:
+        """Create a client card wired to this card's client signals.
+
+        Args:
+            client_id: The client ID.
+            name: Name of the client.
+            volume: Current volume.
+            muted: Whether the client is muted.
+            connected: Whether the client is connected.
+
+        Returns:
+            The new card, selected if it is the selected client.
+        """
+        card = ClientCard(
+            client_id=client_id, name=name, volume=volume, muted=muted, connected=connected
+        )
+        self._connect_client_card(card)
+        card.set_selected(client_id == self._selected_client_id)
+        return card
+
+    def _connect_client_card(self, card: ClientCard) -> None:
+        """Forward a client card's signals to this card's client signals.
+
+        Signals are chained signal-to-signal, which Qt relays without calling
+        back into Python. Client cards live on the GUI thread, so skip
+        AutoConnection's per-emit thread check.
+
+        Args:
+            card: The client card to wire up.
+        """
+        direct = Qt.ConnectionType.DirectConnection
+        card.volume_changed.connect(self.client_volume_changed, direct)
+        card.mute_toggled.connect(self.client_mute_toggled, direct)
+        card.clicked.connect(self.client_clicked, direct)
+        card.rename_requested.connect(self.client_rename_requested, direct)
+
     def refresh_theme(self) -> None:
         """Refresh styles when theme changes."""
-        # Re-run _setup_styles to update base/selected styles
-        self._setup_styles()
-        # Re-apply current selection state
-        self.setStyleSheet(self._selected_style if self._selected else self._base_style)
-
-        p = theme_manager.palette
-        self._name_label.setStyleSheet(
-            f"font-weight: bold; font-size: {typography.title}pt;"
-            f" padding: {spacing.xs}px; color: {p.text};"
-        )
-        self._source_label.setStyleSheet(f"color: {p.text_disabled};")
-        self._client_list_label.setStyleSheet(
-            f"color: {p.text_disabled}; font-size: {typography.body}pt;"
-        )
+        # Card and label styles follow the app-wide stylesheet on their own
         # Refresh volume slider
         self._volume_slider.refresh_theme()
         # Refresh all client cards
@@ -13,7 +13,7 @@ Usage:
 
 from __future__ import annotations
 
-from PySide6.QtCore import Signal
+from PySide6.QtCore import QSignalBlocker, Signal
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -358,9 +358,8 @@ class PreferencesDialog(QDialog):
         self._original_theme = theme
         idx = self._theme_combo.findData(theme)
         if idx >= 0:
-            self._theme_combo.blockSignals(True)
-            self._theme_combo.setCurrentIndex(idx)
-            self._theme_combo.blockSignals(False)
+            with QSignalBlocker(self._theme_combo):
+                self._theme_combo.setCurrentIndex(idx)
 
         # Snapclient
         self._sc_enabled.setChecked(c.get_snapclient_enabled())
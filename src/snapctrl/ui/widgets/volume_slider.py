@@ -1,6 +1,6 @@
 """Volume slider with mute button."""
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QSignalBlocker, Qt, Signal, Slot
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -12,6 +12,10 @@ from PySide6.QtWidgets import (
 from snapctrl.ui.theme import theme_manager
 from snapctrl.ui.tokens import sizing, spacing
 
+# Mute button glyphs, shared by every state transition
+_MUTED_ICON = "🔇"
+_UNMUTED_ICON = "🔊"
+
 
 class VolumeSlider(QWidget):
     """Volume slider with integrated mute button.
@@ -53,7 +57,7 @@ class VolumeSlider(QWidget):
 
         # Mute button
         p = theme_manager.palette
-        self._mute_button = QPushButton("🔊")
+        self._mute_button = QPushButton(_UNMUTED_ICON)
         self._mute_button.setFixedSize(sizing.control_button, sizing.control_button)
         self._mute_button.setFlat(True)
         self._mute_button.setStyleSheet(f"""
@@ -73,6 +77,7 @@ class VolumeSlider(QWidget):
         self._muted = False
         self._volume_before_mute = 50
 
+    @Slot(int)
     def _on_volume_changed(self, value: int) -> None:
         """Handle slider value change.
 
@@ -83,6 +88,7 @@ class VolumeSlider(QWidget):
         if not self._muted:
             self.volume_changed.emit(value)
 
+    @Slot()
     def _toggle_mute(self) -> None:
         """Toggle mute state."""
         self._muted = not self._muted
@@ -90,18 +96,16 @@ class VolumeSlider(QWidget):
         if self._muted:
             # Save current volume and mute
             self._volume_before_mute = self._slider.value()
-            self._slider.blockSignals(True)
-            self._slider.setValue(0)
-            self._slider.blockSignals(False)
+            with QSignalBlocker(self._slider):
+                self._slider.setValue(0)
             self._volume_label.setText("M")
-            self._mute_button.setText("🔇")
+            self._mute_button.setText(_MUTED_ICON)
         else:
             # Restore volume and unmute
-            self._slider.blockSignals(True)
-            self._slider.setValue(self._volume_before_mute)
-            self._slider.blockSignals(False)
+            with QSignalBlocker(self._slider):
+                self._slider.setValue(self._volume_before_mute)
             self._volume_label.setText(f"{self._volume_before_mute}%")
-            self._mute_button.setText("🔊")
+            self._mute_button.setText(_UNMUTED_ICON)
 
         # Only emit mute_toggled - the handler should use the stored volume
         self.mute_toggled.emit(self._muted)
@@ -127,10 +131,12 @@ class VolumeSlider(QWidget):
         """
         if self._slider.isSliderDown():
             return
-        self._slider.blockSignals(True)
-        self._slider.setValue(volume)
-        self._volume_label.setText(f"{volume}%")
-        self._slider.blockSignals(False)
+        # Server updates mostly repeat the current volume; skip the widget writes
+        if not self._muted and volume == self._slider.value() == self._volume_before_mute:
+            return
+        with QSignalBlocker(self._slider):
+            self._slider.setValue(volume)
+            self._volume_label.setText(f"{volume}%")
 
         # Always update _volume_before_mute so unmuting restores to the new volume
         if not self._muted:
@@ -139,9 +145,8 @@ class VolumeSlider(QWidget):
             # When muted, still update the stored volume so unmute uses new value
             self._volume_before_mute = volume
             # Reset slider to 0 to maintain muted state
-            self._slider.blockSignals(True)
-            self._slider.setValue(0)
-            self._slider.blockSignals(False)
+            with QSignalBlocker(self._slider):
+                self._slider.setValue(0)
 
     def set_muted(self, muted: bool) -> None:
         """Set the mute state without emitting signals (for external updates).
@@ -161,17 +166,15 @@ class VolumeSlider(QWidget):
 
         if muted:
             self._volume_before_mute = self._slider.value()
-            self._slider.blockSignals(True)
-            self._slider.setValue(0)
-            self._slider.blockSignals(False)
+            with QSignalBlocker(self._slider):
+                self._slider.setValue(0)
             self._volume_label.setText("M")
-            self._mute_button.setText("🔇")
+            self._mute_button.setText(_MUTED_ICON)
         else:
-            self._slider.blockSignals(True)
-            self._slider.setValue(self._volume_before_mute)
-            self._slider.blockSignals(False)
+            with QSignalBlocker(self._slider):
+                self._slider.setValue(self._volume_before_mute)
             self._volume_label.setText(f"{self._volume_before_mute}%")
-            self._mute_button.setText("🔊")
+            self._mute_button.setText(_UNMUTED_ICON)
 
     def set_volume_and_mute(self, volume: int, muted: bool) -> None:
         """Set both volume and mute state atomically without emitting signals.
@@ -189,17 +192,15 @@ class VolumeSlider(QWidget):
         self._volume_before_mute = volume
 
         if muted:
-            self._slider.blockSignals(True)
-            self._slider.setValue(0)
-            self._slider.blockSignals(False)
+            with QSignalBlocker(self._slider):
+                self._slider.setValue(0)
             self._volume_label.setText("M")
-            self._mute_button.setText("🔇")
+            self._mute_button.setText(_MUTED_ICON)
         else:
-            self._slider.blockSignals(True)
-            self._slider.setValue(volume)
-            self._slider.blockSignals(False)
+            with QSignalBlocker(self._slider):
+                self._slider.setValue(volume)
             self._volume_label.setText(f"{volume}%")
-            self._mute_button.setText("🔊")
+            self._mute_button.setText(_UNMUTED_ICON)
 
     def refresh_theme(self) -> None:
         """Refresh styles when theme changes."""
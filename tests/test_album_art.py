@@ -1,5 +1,6 @@
 """Tests for album art providers."""
 
+import asyncio
 import urllib.error
 from unittest.mock import MagicMock
 
@@ -112,6 +113,56 @@ class MockProvider(AlbumArtProvider):
         return self._return_art
 
 
+class SlowProvider(MockProvider):
+    """Mock provider that takes a while to answer, optionally setting an event on start."""
+
+    def __init__(
+        self,
+        name: str,
+        delay: float,
+        return_art: AlbumArt | None = None,
+        opens: asyncio.Event | None = None,
+    ) -> None:
+        super().__init__(name, return_art)
+        self._delay = delay
+        self.cancelled = False
+        self._opens = opens
+
+    async def fetch(self, artist: str, album: str, title: str = "") -> AlbumArt | None:
+        self.fetch_count += 1
+        if self._opens is not None:
+            self._opens.set()
+        try:
+            await asyncio.sleep(self._delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return self._return_art
+
+
+class GatedProvider(MockProvider):
+    """Mock provider that answers once an event is set, and can set one itself."""
+
+    def __init__(
+        self,
+        name: str,
+        return_art: AlbumArt | None = None,
+        gate: asyncio.Event | None = None,
+        opens: asyncio.Event | None = None,
+    ) -> None:
+        super().__init__(name, return_art)
+        self._gate = gate
+        self._opens = opens
+
+    async def fetch(self, artist: str, album: str, title: str = "") -> AlbumArt | None:
+        self.fetch_count += 1
+        if self._opens is not None:
+            self._opens.set()
+        if self._gate is not None:
+            await self._gate.wait()
+        return self._return_art
+
+
 class TestFallbackProvider:
     """Tests for fallback album art provider."""
 
@@ -134,7 +185,7 @@ class TestFallbackProvider:
 
     @pytest.mark.asyncio
     async def test_fetch_first_success(self) -> None:
-        """Test fetch stops at first successful provider."""
+        """Test fetch prefers the first provider when several succeed."""
         art = AlbumArt(data=b"test", source="A")
         p1 = MockProvider("A", return_art=art)
         p2 = MockProvider("B", return_art=AlbumArt(data=b"other", source="B"))
@@ -144,7 +195,36 @@ class TestFallbackProvider:
 
         assert result == art
         assert p1.fetch_count == 1
-        assert p2.fetch_count == 0  # Never called
+        assert p2.fetch_count == 0  # Primary answered within the hedge delay
+
+    @pytest.mark.asyncio
+    async def test_fetch_hedges_slow_primary(self) -> None:
+        """Test the fallback is queried while a slow primary is still pending."""
+        art = AlbumArt(data=b"test", source="B")
+        fallback_started = asyncio.Event()
+        p1 = GatedProvider("A", gate=fallback_started)
+        p2 = GatedProvider("B", return_art=art, opens=fallback_started)
+
+        provider = FallbackAlbumArtProvider([p1, p2], hedge_delay=0)
+        result = await asyncio.wait_for(provider.fetch(artist="Artist", album="Album"), 5.0)
+
+        assert result == art
+        assert p1.fetch_count == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_cancels_hedged_fallback(self) -> None:
+        """Test a hedged lower-priority lookup is cancelled once art is found."""
+        art = AlbumArt(data=b"test", source="A")
+        fallback_started = asyncio.Event()
+        p1 = GatedProvider("A", return_art=art, gate=fallback_started)
+        p2 = SlowProvider("B", delay=10.0, opens=fallback_started)
+
+        provider = FallbackAlbumArtProvider([p1, p2], hedge_delay=0)
+        result = await asyncio.wait_for(provider.fetch(artist="Artist", album="Album"), 5.0)
+
+        assert result == art
+        await asyncio.sleep(0)
+        assert p2.cancelled
 
     @pytest.mark.asyncio
     async def test_fetch_fallback_on_none(self) -> None:
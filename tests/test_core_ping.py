@@ -78,6 +78,10 @@ class TestFormatRtt:
         """Test formatting RTT of exactly 1ms."""
         assert format_rtt(1.0) == "1.0ms"
 
+    def test_format_exactly_precision_threshold(self) -> None:
+        """Test RTT at the precision threshold drops the decimal."""
+        assert format_rtt(10.0) == "10ms"
+
 
 class TestGetRttColor:
     """Tests for get_rtt_color function."""
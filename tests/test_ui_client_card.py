@@ -192,11 +192,33 @@ class TestClientCardSelection:
 
         card.set_selected(True)
         assert card._selected is True
-        assert "border: 2px" in card.styleSheet()
+        assert card.property("selected") is True
+        assert card.styleSheet() == ""
 
         card.set_selected(False)
         assert card._selected is False
 
+    def test_set_selected_unchanged_skips_restyle(self, qtbot: QtBot) -> None:
+        """Test re-applying the current selection does not re-polish the card."""
+        card = ClientCard(client_id="c1", name="Test")
+        qtbot.addWidget(card)
+        card.set_selected(True)
+
+        with patch.object(card, "setProperty") as set_property:
+            card.set_selected(True)
+
+        set_property.assert_not_called()
+
+    def test_set_connected_unchanged_skips_restyle(self, qtbot: QtBot) -> None:
+        """Test re-applying the current connection state leaves the indicator alone."""
+        card = ClientCard(client_id="c1", name="Test", connected=True)
+        qtbot.addWidget(card)
+
+        with patch.object(card._status_indicator, "setStyleSheet") as set_style:
+            card.set_connected(True)
+
+        set_style.assert_not_called()
+
 
 class TestClientCardClicked:
     """Test client card click handling."""
@@ -1,7 +1,10 @@
 """Tests for MainWindow."""
 
+from dataclasses import replace
 from unittest.mock import MagicMock, Mock
 
+from PySide6.QtGui import QPalette
+from PySide6.QtWidgets import QApplication, QLabel
 from pytestqt.qtbot import QtBot
 
 from snapctrl.core.config import ConfigManager
@@ -10,6 +13,9 @@ from snapctrl.models.client import Client
 from snapctrl.models.group import Group
 from snapctrl.models.source import Source
 from snapctrl.ui.main_window import MainWindow
+from snapctrl.ui.theme import DARK_PALETTE, theme_manager
+from snapctrl.ui.tokens import typography
+from snapctrl.ui.widgets.group_card import GroupCard
 
 
 class TestMainWindowBasics:
@@ -124,12 +130,35 @@ class TestMainWindowStyling:
     """Test MainWindow styling."""
 
     def test_has_stylesheet(self, qtbot: QtBot) -> None:
-        """Test that main window has styling applied."""
+        """Test that main window styling comes from the app-wide stylesheet."""
         window = MainWindow()
         qtbot.addWidget(window)
+        theme_manager.apply_theme(DARK_PALETTE)
 
-        assert window.styleSheet() != ""
-        assert "background-color" in window.styleSheet()
+        app_style = QApplication.instance().styleSheet()  # type: ignore[union-attr]
+        assert "QMainWindow" in app_style
+        assert "background-color" in app_style
+        assert window.styleSheet() == ""
+
+    def test_base_rules_scoped_to_main_window(self, qtbot: QtBot) -> None:
+        """Test the base widget rules reach the window's widgets but no other window."""
+        window = MainWindow()
+        qtbot.addWidget(window)
+        theme_manager.apply_theme(DARK_PALETTE)
+        inside = QLabel("inside", window.centralWidget())
+        outside = QLabel("outside")
+        qtbot.addWidget(outside)
+        card = GroupCard()
+        card.setParent(window.centralWidget())
+
+        for widget in (inside, outside, card._name_label):
+            widget.ensurePolished()
+
+        assert window.objectName() == "MainWindow"
+        assert inside.palette().color(QPalette.ColorRole.Window).name() == DARK_PALETTE.surface
+        assert outside.palette().color(QPalette.ColorRole.Window).name() != DARK_PALETTE.surface
+        # Object-name rules stay more specific than the scoped base rules
+        assert card._name_label.font().pointSize() == typography.title
 
 
 class TestMainWindowWithState:
@@ -219,6 +248,17 @@ class TestMainWindowStateChanges:
         client = Client(id="c1", host="h", name="C", volume=50, muted=False, connected=True)
         window._on_clients_changed([client])
 
+    def test_state_signal_updates_panel_synchronously(self, qtbot: QtBot) -> None:
+        """Test a StateStore emission reaches the panel without an event-loop pass."""
+        state = StateStore()
+        window = MainWindow(state_store=state)
+        qtbot.addWidget(window)
+
+        state.sources_changed.emit([Source(id="s1", name="Source", status="playing")])
+
+        # No processEvents(): a queued connection would not have run yet
+        assert "s1" in window._sources_panel._items_by_id
+
 
 class TestMainWindowSelection:
     """Test selection handling."""
@@ -336,6 +376,46 @@ class TestMainWindowPingResults:
 
         assert window._ping_results == results
 
+    def test_ping_refreshes_are_coalesced(self, qtbot: QtBot) -> None:
+        """Test bursts of ping results render the selected client once."""
+        state = StateStore()
+        window = MainWindow(state_store=state)
+        qtbot.addWidget(window)
+        window.show()
+
+        client = Client(id="c1", host="h", name="C", volume=50, muted=False, connected=True)
+        state._clients = {client.id: client}
+        state._clients_cache = None
+        window._selected_client_id = "c1"
+        window._properties_panel.set_client = MagicMock()  # type: ignore[method-assign]
+
+        window.set_ping_results({"c1": 5.0})
+        window.set_ping_results({"c1": 7.5})
+        assert window._properties_panel.set_client.call_count == 0
+
+        qtbot.waitUntil(lambda: window._properties_panel.set_client.call_count == 1)
+        assert window._properties_panel.set_client.call_args.kwargs["network_rtt"] == 7.5
+
+    def test_refresh_deferred_while_hidden(self, qtbot: QtBot) -> None:
+        """Test a hidden window defers the render until it is shown."""
+        state = StateStore()
+        window = MainWindow(state_store=state)
+        qtbot.addWidget(window)
+
+        client = Client(id="c1", host="h", name="C", volume=50, muted=False, connected=True)
+        state._clients = {client.id: client}
+        state._clients_cache = None
+        window._selected_client_id = "c1"
+        window._properties_panel.set_client = MagicMock()  # type: ignore[method-assign]
+
+        window.set_ping_results({"c1": 5.0})
+        qtbot.waitUntil(lambda: window._client_refresh_pending)
+        window._properties_panel.set_client.assert_not_called()
+
+        window.show()
+
+        window._properties_panel.set_client.assert_called_once()
+
 
 class TestMainWindowTimeStats:
     """Test time stats with selected client."""
@@ -447,6 +527,55 @@ class TestMainWindowClientsChanged:
         # Trigger clients changed
         window._on_clients_changed([client])
 
+    def test_on_clients_changed_skips_unchanged_clients(self, qtbot: QtBot) -> None:
+        """Test group cards are only refreshed when card-visible client state changes."""
+        window = MainWindow(state_store=StateStore())
+        qtbot.addWidget(window)
+        window._groups_panel.set_groups = MagicMock()  # type: ignore[method-assign]
+
+        client = Client(id="c1", host="h", name="C", volume=50, muted=False, connected=True)
+        window._on_clients_changed([client])
+        window._on_clients_changed([client])
+        assert window._groups_panel.set_groups.call_count == 1
+
+        # Fields not shown on cards don't trigger a refresh
+        window._on_clients_changed([replace(client, last_seen_sec=123)])
+        assert window._groups_panel.set_groups.call_count == 1
+
+        window._on_clients_changed([replace(client, volume=60)])
+        assert window._groups_panel.set_groups.call_count == 2
+
+    def test_clients_fingerprint_reset_on_disconnect_and_rebuild(self, qtbot: QtBot) -> None:
+        """Test unchanged clients refresh the cards again after a drop or rebuild."""
+        window = MainWindow(state_store=StateStore())
+        qtbot.addWidget(window)
+        window._groups_panel.set_groups = MagicMock()  # type: ignore[method-assign]
+        client = Client(id="c1", host="h", name="C", volume=50, muted=False, connected=True)
+        window._on_clients_changed([client])
+
+        window.set_connection_status(False)
+        window._on_clients_changed([client])
+        assert window._groups_panel.set_groups.call_count == 2
+
+        window._on_groups_changed([])
+        window._on_clients_changed([client])
+        assert window._groups_panel.set_groups.call_count == 4
+
+    def test_clients_fingerprint_keeps_duplicate_entries(self, qtbot: QtBot) -> None:
+        """Test identical client entries don't cancel out of the fingerprint."""
+        window = MainWindow(state_store=StateStore())
+        qtbot.addWidget(window)
+        window._groups_panel.set_groups = MagicMock()  # type: ignore[method-assign]
+        c1 = Client(id="c1", host="h", name="C", volume=50, connected=True)
+        c2 = Client(id="c2", host="h", name="D", volume=50, connected=True)
+        window._on_clients_changed([])
+
+        # Under XOR the two identical c1 entries cancel, matching the empty list
+        window._on_clients_changed([c1, c1])
+        window._on_clients_changed([c2, c1, c2])
+
+        assert window._groups_panel.set_groups.call_count == 3
+
 
 class TestMainWindowSetHideToTray:
     """Test hide to tray setting."""
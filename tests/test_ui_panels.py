@@ -369,7 +369,7 @@ class TestPropertiesPanel:
             "samples": 50,
         }
         panel.set_client(client, time_stats=stats)
-        # Should not crash — _add_time_stats_rows catches TypeError/ValueError
+        # Should not crash — _time_stats_rows catches TypeError/ValueError
         text = panel._content.text()
         assert "Speaker" in text or "10.0.0.1" in text
 
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import pytest
+from PySide6.QtCore import Qt
 from pytestqt.qtbot import QtBot
 
 from snapctrl.models.client import Client
 from snapctrl.models.group import Group
 from snapctrl.models.source import Source, SourceStatus
-from snapctrl.ui.panels.properties import PropertiesPanel, _format_jitter
+from snapctrl.ui.panels.properties import PropertiesPanel, _format_jitter, _rtt_cell
 
 
 @pytest.fixture
@@ -70,6 +71,16 @@ class TestPropertiesPanelCreation:
         qtbot.addWidget(panel)
         assert "Select an item" in panel._content.text()
 
+    def test_rich_text_enabled_on_first_selection(self, qtbot: QtBot, sample_group: Group) -> None:
+        """Test placeholder stays plain text until an item is selected."""
+        panel = PropertiesPanel()
+        qtbot.addWidget(panel)
+        assert panel._content.textFormat() == Qt.TextFormat.PlainText
+
+        panel.set_group(sample_group)
+
+        assert panel._content.textFormat() == Qt.TextFormat.RichText
+
     def test_has_latency_signal(self, qtbot: QtBot) -> None:
         """Test panel has latency_changed signal."""
         panel = PropertiesPanel()
@@ -115,6 +126,32 @@ class TestPropertiesPanelSetGroup:
 
         assert "Muted" in panel._content.text()
 
+    def test_set_group_html_is_single_line(self, qtbot: QtBot, sample_group: Group) -> None:
+        """Test rendered group HTML has no whitespace scaffolding."""
+        panel = PropertiesPanel()
+        qtbot.addWidget(panel)
+
+        panel.set_group(sample_group)
+
+        html = panel._content.text()
+        assert "\n" not in html
+        assert html.startswith("<h3>Living Room</h3>")
+
+    def test_set_group_unchanged_skips_relayout(
+        self, qtbot: QtBot, sample_group: Group, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test re-displaying identical content does not touch the label."""
+        panel = PropertiesPanel()
+        qtbot.addWidget(panel)
+        panel.set_group(sample_group)
+
+        calls: list[str] = []
+        monkeypatch.setattr(panel._content, "setText", calls.append)
+        monkeypatch.setattr(panel._content, "setStyleSheet", calls.append)
+        panel.set_group(sample_group)
+
+        assert calls == []
+
 
 class TestPropertiesPanelSetClient:
     """Test client display."""
@@ -177,6 +214,18 @@ class TestPropertiesPanelSetClient:
 
         assert "Measuring" in panel._content.text()
 
+    def test_set_client_escapes_model_text(self, qtbot: QtBot) -> None:
+        """Test client fields are HTML-escaped before rendering."""
+        panel = PropertiesPanel()
+        qtbot.addWidget(panel)
+
+        client = Client(id="c1", host="h", name="<Kitchen & Bath>", mac="aa<bb")
+        panel.set_client(client)
+
+        text = panel._content.text()
+        assert "&lt;Kitchen &amp; Bath&gt;" in text
+        assert "aa&lt;bb" in text
+
     def test_set_client_creates_latency_widget(self, qtbot: QtBot, sample_client: Client) -> None:
         """Test connected client creates latency spinbox."""
         panel = PropertiesPanel()
@@ -344,3 +393,23 @@ class TestFormatJitter:
         result = _format_jitter(50)
         assert "ms" in result
         assert "50" in result
+
+
+class TestRttCell:
+    """Test _rtt_cell cached RTT formatting."""
+
+    def test_escapes_sub_millisecond(self) -> None:
+        """Test sub-millisecond RTT text is HTML-escaped."""
+        assert _rtt_cell(0.4)[0] == "&lt;1ms"
+
+    def test_quantized_values_share_cache_entry(self, qtbot: QtBot, sample_client: Client) -> None:
+        """Test RTTs that display identically reuse one cache entry."""
+        panel = PropertiesPanel()
+        qtbot.addWidget(panel)
+        _rtt_cell.cache_clear()
+
+        panel.set_client(sample_client, network_rtt=42.3)
+        panel.set_client(sample_client, network_rtt=42.8)
+
+        assert _rtt_cell.cache_info().misses == 1
+        assert "42ms" in panel._content.text()
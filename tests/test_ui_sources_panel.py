@@ -3,16 +3,44 @@
 from __future__ import annotations
 
 import base64
+from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
-from PySide6.QtCore import QBuffer, QEvent, QIODevice
-from PySide6.QtGui import QImage, QPixmap
-from PySide6.QtWidgets import QListWidgetItem
+from PySide6.QtCore import QBuffer, QEvent, QIODevice, Qt
+from PySide6.QtGui import QColor, QImage, QImageReader, QPalette, QPixmap, QPixmapCache
+from PySide6.QtNetwork import QNetworkDiskCache, QNetworkReply, QNetworkRequest
+from PySide6.QtWidgets import QLabel, QListWidgetItem, QStyleOptionViewItem
 from pytestqt.qtbot import QtBot
 
+from snapctrl.api.album_art import AlbumArt
 from snapctrl.models.source import Source, SourceStatus
-from snapctrl.ui.panels.sources import MAX_ALBUM_ART_B64_SIZE, SourcesPanel
+from snapctrl.ui.panels.sources import (
+    _ART_CACHE_PREFIX,
+    _ART_DISK_CACHE_SIZE,
+    ALBUM_ART_SIZE,
+    MAX_ALBUM_ART_B64_SIZE,
+    MAX_HTTP_ART_SIZE,
+    SourcesPanel,
+    _load_scaled_pixmap,
+    install_album_art_disk_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_pixmap_cache() -> None:
+    """Keep album art cached by one test from leaking into the next."""
+    QPixmapCache.clear()
+
+
+def _encode_image(width: int, height: int, fmt: str = "PNG") -> bytes:
+    """Encode a solid-color test image."""
+    image = QImage(width, height, QImage.Format.Format_RGB32)
+    image.fill(0x0000FF)
+    buffer = QBuffer()
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, fmt)
+    return buffer.data().data()
 
 
 @pytest.fixture
@@ -164,6 +192,72 @@ class TestNowPlayingDisplay:
         assert panel._sources[0].meta_artist == ""
 
 
+class TestSourcesDiffUpdate:
+    """Test set_sources updates rows in place by source ID."""
+
+    def test_existing_items_reused(
+        self, qtbot: QtBot, idle_source: Source, playing_source: Source
+    ) -> None:
+        """Test unchanged sources keep their list items."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        panel.set_sources([idle_source, playing_source])
+        first = panel._list.item(0)
+
+        panel.set_sources([idle_source, playing_source])
+
+        assert panel._list.item(0) is first
+        assert panel._list.count() == 2
+
+    def test_status_change_updates_item_in_place(self, qtbot: QtBot, idle_source: Source) -> None:
+        """Test playing-state change rewrites the existing item's text."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        panel.set_sources([idle_source])
+        item = panel._list.item(0)
+
+        playing = Source(id=idle_source.id, name=idle_source.name, status=SourceStatus.PLAYING)
+        panel.set_sources([playing])
+
+        assert panel._list.item(0) is item
+        assert item.text().startswith("▶")
+
+    def test_playing_rows_colored_by_delegate(
+        self, qtbot: QtBot, idle_source: Source, playing_source: Source
+    ) -> None:
+        """Test the item delegate paints playing rows green."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        panel.set_sources([idle_source, playing_source])
+
+        delegate = panel._list.itemDelegate()
+        colors = []
+        for row in range(2):
+            option = QStyleOptionViewItem()
+            delegate.initStyleOption(option, panel._list.model().index(row, 0))
+            colors.append(option.palette.color(QPalette.ColorRole.Text))
+
+        assert colors[0] != QColor(Qt.GlobalColor.green)
+        assert colors[1] == QColor(Qt.GlobalColor.green)
+
+    def test_reorder_and_remove(
+        self, qtbot: QtBot, idle_source: Source, playing_source: Source
+    ) -> None:
+        """Test rows follow the new source order and removed sources go away."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        extra = Source(id="s3", name="Extra", status=SourceStatus.IDLE)
+        panel.set_sources([idle_source, playing_source, extra])
+        panel._list.setCurrentRow(2)  # Select extra
+
+        panel.set_sources([extra, idle_source])
+
+        ids = [panel._list.item(i).data(Qt.ItemDataRole.UserRole) for i in range(2)]
+        assert ids == ["s3", "s1"]
+        assert panel._list.count() == 2
+        assert panel.get_selected_source_id() == "s3"
+
+
 class TestServerHost:
     """Test server host configuration."""
 
@@ -213,6 +307,84 @@ class TestAlbumArtHandling:
 
         assert panel._network_manager is not None
 
+    def test_panels_share_network_manager(self, qtbot: QtBot) -> None:
+        """Test panels reuse one network manager with distinct reply tags."""
+        first = SourcesPanel()
+        second = SourcesPanel()
+        qtbot.addWidget(first)
+        qtbot.addWidget(second)
+
+        assert first._network_manager is second._network_manager
+        assert first._reply_tag != second._reply_tag
+
+    def test_panel_creates_no_disk_cache(self, qtbot: QtBot) -> None:
+        """Test building a panel leaves the user's cache directory alone."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+
+        assert panel._network_manager.cache() is None
+
+    def test_install_disk_cache(self, qtbot: QtBot, tmp_path: Path) -> None:
+        """Test album art requests go through a bounded disk cache once installed."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        cache_dir = tmp_path / "album-art"
+
+        install_album_art_disk_cache(str(cache_dir))
+        try:
+            cache = panel._network_manager.cache()
+            assert isinstance(cache, QNetworkDiskCache)
+            assert cache.maximumCacheSize() == _ART_DISK_CACHE_SIZE
+            assert Path(cache.cacheDirectory()) == cache_dir
+        finally:
+            panel._network_manager.setCache(None)
+
+    def test_http_art_request_prefers_cache(self, qtbot: QtBot) -> None:
+        """Test art requests are served from the disk cache when possible."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        mock_manager = MagicMock()
+
+        with patch.object(panel, "_network_manager", mock_manager):
+            panel._fetch_http_art("http://example.com/art.jpg")
+
+        request = mock_manager.get.call_args.args[0]
+        assert (
+            request.attribute(QNetworkRequest.Attribute.CacheLoadControlAttribute)
+            == QNetworkRequest.CacheLoadControl.PreferCache
+        )
+
+    def test_http_art_request_accepts_decodable_images(self, qtbot: QtBot) -> None:
+        """Test art requests offer WebP only when Qt has a plugin to decode it."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        mock_manager = MagicMock()
+
+        with patch.object(panel, "_network_manager", mock_manager):
+            panel._fetch_http_art("http://example.com/art.jpg")
+
+        accept = mock_manager.get.call_args.args[0].rawHeader("Accept").data()
+        webp_supported = b"image/webp" in {
+            bytes(mime.data()) for mime in QImageReader.supportedMimeTypes()
+        }
+        assert accept.startswith(b"image/webp") == webp_supported
+        assert b"image/*" in accept
+
+    def test_network_reply_routed_by_tag(self, qtbot: QtBot) -> None:
+        """Test only replies tagged for this panel reach its handler."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        own_reply = Mock()
+        own_reply.request.return_value.attribute.return_value = panel._reply_tag
+        other_reply = Mock()
+        other_reply.request.return_value.attribute.return_value = panel._reply_tag + 1
+
+        with patch.object(panel, "_on_http_art_finished") as handler:
+            panel._on_network_reply(other_reply)
+            panel._on_network_reply(own_reply)
+
+        handler.assert_called_once_with(own_reply)
+
 
 class TestWidgetCreation:
     """Test widget hierarchy."""
@@ -318,6 +490,20 @@ class TestGetSourceById:
 
         assert found is None
 
+    def test_lookup_follows_latest_sources(
+        self, qtbot: QtBot, idle_source: Source, playing_source: Source
+    ) -> None:
+        """Test lookup reflects the most recent set_sources call."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        panel.set_sources([idle_source, playing_source])
+        assert panel._get_source_by_id("s2") is playing_source
+
+        panel.set_sources([idle_source])
+
+        assert panel._get_source_by_id("s1") is idle_source
+        assert panel._get_source_by_id("s2") is None
+
 
 class TestPrivateIP:
     """Test _is_private_ip method."""
@@ -483,6 +669,7 @@ class TestClearSources:
 
         panel.clear_sources()
         assert panel._list.count() == 0
+        assert panel._get_source_by_id(idle_source.id) is None
 
 
 class TestUpdateDetails:
@@ -499,6 +686,25 @@ class TestUpdateDetails:
         # No metadata, so metadata fields should be cleared
         assert panel._current_artist == ""
 
+    def test_update_details_repeat_skips_widget_updates(
+        self, qtbot: QtBot, idle_source: Source
+    ) -> None:
+        """Test re-applying the same source does not touch the detail labels."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        panel._update_details(idle_source)
+
+        labels = (panel._detail_status, panel._detail_type, panel._detail_codec)
+        with (
+            patch.object(panel._detail_format, "setVisible") as set_visible,
+            patch.object(QLabel, "setText") as set_text,
+        ):
+            panel._update_details(idle_source)
+
+        set_visible.assert_not_called()
+        set_text.assert_not_called()
+        assert all(label.text() for label in labels)
+
     def test_update_details_playing_source(self, qtbot: QtBot, playing_source: Source) -> None:
         """Test updating details for playing source."""
         panel = SourcesPanel()
@@ -569,6 +775,25 @@ class TestUpdateDetails:
         assert panel._current_album == ""
         assert "Song" in panel._detail_now_playing.text()
 
+    def test_update_details_escapes_metadata(self, qtbot: QtBot) -> None:
+        """Test track metadata is escaped before going into the rich-text label."""
+        source = Source(
+            id="s1",
+            name="Test",
+            status=SourceStatus.PLAYING,
+            meta_title="Rock & Roll <Live>",
+            meta_artist="A&B",
+            meta_album="",
+        )
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+
+        panel._update_details(source)
+
+        text = panel._detail_now_playing.text()
+        assert "Rock &amp; Roll &lt;Live&gt;" in text
+        assert "A&amp;B" in text
+
 
 class TestRefreshThemeWithMetadata:
     """Test refresh_theme with metadata."""
@@ -642,6 +867,31 @@ class TestShowPlaceholder:
         panel._show_album_art_placeholder()
         assert panel._original_pixmap is None
 
+    def test_repeat_placeholder_skips_restyle(self, qtbot: QtBot) -> None:
+        """Test showing the placeholder again does not re-apply its stylesheet."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        panel._show_album_art_placeholder()
+
+        with patch.object(panel._album_art, "setStyleSheet") as set_style:
+            panel._show_album_art_placeholder()
+
+        set_style.assert_not_called()
+
+    def test_placeholder_after_art_restyles(self, qtbot: QtBot) -> None:
+        """Test the placeholder is re-applied once real art has been shown."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        panel._show_album_art_placeholder()
+        image = QImage(8, 8, QImage.Format.Format_RGB32)
+        image.fill(0x00FF00)
+        panel._set_pixmap(QPixmap.fromImage(image))
+
+        panel._show_album_art_placeholder()
+
+        assert panel._original_pixmap is None
+        assert "No" in panel._album_art.text()
+
 
 class TestPlayingSourceDisplay:
     """Test displaying playing sources in list."""
@@ -686,6 +936,35 @@ class TestSourceRestoreSelection:
         # Selection should be restored
         assert panel._list.currentRow() == 1
 
+    def test_rebuild_does_not_emit_selection_changes(
+        self, qtbot: QtBot, idle_source: Source, playing_source: Source
+    ) -> None:
+        """Test rebuilding the list does not fire currentItemChanged."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        panel.set_sources([idle_source, playing_source])
+        panel._list.setCurrentRow(1)
+
+        changes: list[object] = []
+        panel._list.currentItemChanged.connect(lambda cur, _prev: changes.append(cur))
+        panel.set_sources([idle_source, playing_source])
+
+        assert changes == []
+
+    def test_details_hidden_when_selected_source_removed(
+        self, qtbot: QtBot, idle_source: Source, playing_source: Source
+    ) -> None:
+        """Test details frame hides when the selected source disappears."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        panel.set_sources([idle_source, playing_source])
+        panel._list.setCurrentRow(1)
+        assert not panel._details_frame.isHidden()
+
+        panel.set_sources([idle_source])
+
+        assert panel._details_frame.isHidden()
+
 
 class TestSetServerHost:
     """Test set_server_host method."""
@@ -746,6 +1025,19 @@ class TestSetPixmap:
         assert panel._original_pixmap is not None
         assert not panel._original_pixmap.isNull()
 
+    def test_repeat_set_pixmap_keeps_stylesheet(self, qtbot: QtBot) -> None:
+        """Test loading art again does not re-apply the unchanged stylesheet."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        image = QImage(8, 8, QImage.Format.Format_RGB32)
+        image.fill(0x00FF00)
+        panel._set_pixmap(QPixmap.fromImage(image))
+
+        with patch.object(panel._album_art, "setStyleSheet") as set_style:
+            panel._set_pixmap(QPixmap.fromImage(image))
+
+        set_style.assert_not_called()
+
     def test_set_pixmap_scales_large_image(self, qtbot: QtBot) -> None:
         """Test _set_pixmap scales down large images."""
         panel = SourcesPanel()
@@ -764,6 +1056,28 @@ class TestSetPixmap:
         assert panel._original_pixmap.height() <= panel._MAX_STORED_PIXMAP_SIZE
 
 
+class TestLoadScaledPixmap:
+    """Test _load_scaled_pixmap decode-time downscaling."""
+
+    def test_large_image_decoded_at_target_size(self, qtbot: QtBot) -> None:
+        """Test large images come back scaled with aspect ratio kept."""
+        pixmap = _load_scaled_pixmap(_encode_image(1000, 500, "JPEG"), 200)
+
+        assert pixmap is not None
+        assert (pixmap.width(), pixmap.height()) == (200, 100)
+
+    def test_small_image_not_upscaled(self, qtbot: QtBot) -> None:
+        """Test images already within the limit keep their size."""
+        pixmap = _load_scaled_pixmap(_encode_image(64, 32), 200)
+
+        assert pixmap is not None
+        assert (pixmap.width(), pixmap.height()) == (64, 32)
+
+    def test_invalid_data_returns_none(self, qtbot: QtBot) -> None:
+        """Test undecodable data yields None."""
+        assert _load_scaled_pixmap(b"not an image", 200) is None
+
+
 class TestUpdateArtHeight:
     """Test _update_art_height method."""
 
@@ -793,6 +1107,25 @@ class TestUpdateArtHeight:
         panel._original_pixmap = QPixmap(1, 0)
         panel._update_art_height()  # Should not crash
 
+    def test_update_art_height_scales_at_device_resolution(self, qtbot: QtBot) -> None:
+        """Test art is pre-scaled for the screen's pixel ratio, not rescaled per paint."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        panel._album_art.resize(200, ALBUM_ART_SIZE)
+        panel._original_pixmap = QPixmap.fromImage(QImage.fromData(_encode_image(400, 400)))
+
+        with (
+            patch.object(QLabel, "devicePixelRatioF", return_value=2.0),
+            patch.object(panel._album_art, "setPixmap") as set_pixmap,
+        ):
+            panel._update_art_height()
+
+        shown = set_pixmap.call_args.args[0]
+        assert panel._album_art.hasScaledContents() is False
+        assert shown.devicePixelRatio() == 2.0
+        assert (shown.width(), shown.height()) == (400, 400)
+        assert shown.deviceIndependentSize().width() == 200
+
 
 class TestApplyFallbackArt:
     """Test _apply_fallback_art method."""
@@ -886,6 +1219,15 @@ class TestLoadDataUriImage:
 
         assert result is False
 
+    def test_data_uri_separator_beyond_header_limit(self, qtbot: QtBot) -> None:
+        """Test a separator far into the string is not taken as the header end."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+
+        result = panel._load_data_uri_image("data:" + "x" * 1000 + ",AAAA")
+
+        assert result is False
+
     def test_data_uri_too_large(self, qtbot: QtBot) -> None:
         """Test _load_data_uri_image rejects oversized data."""
         panel = SourcesPanel()
@@ -899,6 +1241,15 @@ class TestLoadDataUriImage:
 
         assert result is False
 
+    def test_data_uri_limit_counts_payload_only(self, qtbot: QtBot) -> None:
+        """Test the size limit applies to the base64 payload, not the header."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        data_uri = "data:image/jpeg;base64," + "A" * MAX_ALBUM_ART_B64_SIZE
+
+        with patch("snapctrl.ui.panels.sources.threading.Thread"):
+            assert panel._load_data_uri_image(data_uri) is True
+
     def test_valid_data_uri_starts_decode(self, qtbot: QtBot) -> None:
         """Test _load_data_uri_image starts async decode for valid data."""
         panel = SourcesPanel()
@@ -920,6 +1271,85 @@ class TestLoadDataUriImage:
         # Generation should have been incremented
         assert panel._fallback_generation > initial_gen
 
+    def test_decode_thread_produces_decoded_payload(self, qtbot: QtBot) -> None:
+        """Test the decode worker stores the Qt-decoded payload for the UI thread."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+
+        data_uri = "data:image/png;base64," + base64.b64encode(_encode_image(16, 8)).decode()
+
+        # Run the worker inline so no thread outlives the test
+        with patch("snapctrl.ui.panels.sources.threading.Thread") as mock_thread:
+            mock_thread.side_effect = lambda target, daemon: MagicMock(start=target)
+            with patch.object(panel, "_art_decoded"):
+                assert panel._load_data_uri_image(data_uri) is True
+
+        assert panel._pending_fallback_art is not None
+        image, _mime, source = panel._pending_fallback_art
+        assert (image.width(), image.height()) == (16, 8)
+        assert source == "data-uri"
+
+    def test_decode_thread_drops_undecodable_image(self, qtbot: QtBot) -> None:
+        """Test payloads that are not images never reach the UI thread."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        data_uri = "data:image/jpeg;base64," + base64.b64encode(b"image-bytes").decode()
+
+        with patch("snapctrl.ui.panels.sources.threading.Thread") as mock_thread:
+            mock_thread.side_effect = lambda target, daemon: MagicMock(start=target)
+            with patch.object(panel, "_art_decoded") as decoded:
+                panel._load_data_uri_image(data_uri)
+
+        assert panel._pending_fallback_art is None
+        decoded.emit.assert_not_called()
+
+    def test_decode_thread_skips_empty_payload(self, qtbot: QtBot) -> None:
+        """Test a payload Qt decodes to nothing is dropped before image loading."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+
+        with (
+            patch("snapctrl.ui.panels.sources.threading.Thread") as mock_thread,
+            patch("snapctrl.ui.panels.sources._load_scaled_image") as load,
+        ):
+            mock_thread.side_effect = lambda target, daemon: MagicMock(start=target)
+            panel._load_data_uri_image("data:image/jpeg;base64,")
+
+        load.assert_not_called()
+        assert panel._pending_fallback_art is None
+
+
+class TestRepeatDataUri:
+    """Test repeated data URIs are not decoded again."""
+
+    def test_same_data_uri_loaded_once(self, qtbot: QtBot) -> None:
+        """Test a repeated data URI neither re-hashes nor re-decodes."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        data_uri = "data:image/png;base64," + base64.b64encode(_encode_image(4, 4)).decode()
+
+        with patch.object(panel, "_load_data_uri_image", return_value=True) as load:
+            panel._set_album_art(data_uri)
+            panel._set_album_art(data_uri)
+
+        load.assert_called_once_with(data_uri)
+
+    def test_data_uri_reloaded_after_other_art(self, qtbot: QtBot) -> None:
+        """Test switching to other art and back loads the data URI again."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        data_uri = "data:image/png;base64," + base64.b64encode(_encode_image(4, 4)).decode()
+
+        with (
+            patch.object(panel, "_load_data_uri_image", return_value=True) as load,
+            patch.object(panel, "_try_fallback_art"),
+        ):
+            panel._set_album_art(data_uri)
+            panel._set_album_art("")
+            panel._set_album_art(data_uri)
+
+        assert load.call_count == 2
+
 
 class TestTryFallbackArt:
     """Test _try_fallback_art method."""
@@ -954,6 +1384,41 @@ class TestTryFallbackArt:
         # Should not have started fallback (generation unchanged)
         assert panel._fallback_generation == initial_gen
 
+    def test_try_fallback_art_cancels_superseded_fetch(self, qtbot: QtBot) -> None:
+        """Test a new fallback lookup cancels the in-flight one on the art loop."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        panel._current_artist = "Test Artist"
+        panel._art_loaded = False
+        previous = MagicMock()
+        panel._fallback_future = previous
+
+        with patch("snapctrl.ui.panels.sources.asyncio.run_coroutine_threadsafe") as mock_run:
+            mock_run.side_effect = lambda coro, _loop: coro.close()
+            panel._try_fallback_art()
+
+        previous.cancel.assert_called_once()
+        mock_run.assert_called_once()
+
+    async def test_fetch_fallback_art_stores_result(self, qtbot: QtBot) -> None:
+        """Test the fetch coroutine hands valid art to the UI thread."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        art = AlbumArt(data=_encode_image(16, 8), mime_type="image/png", source="iTunes")
+
+        with (
+            patch.object(panel._art_provider, "fetch", return_value=art),
+            patch.object(panel, "_fallback_art_ready") as ready,
+        ):
+            await panel._fetch_fallback_art("Artist", "Album", "Title", 7)
+
+        assert panel._pending_fallback_art is not None
+        image, mime_type, source = panel._pending_fallback_art
+        assert (image.width(), image.height()) == (16, 8)
+        assert (mime_type, source) == ("image/png", "iTunes")
+        assert panel._pending_fallback_generation == 7
+        ready.emit.assert_called_once()
+
 
 class TestFetchHttpArt:
     """Test _fetch_http_art method."""
@@ -991,6 +1456,180 @@ class TestFetchHttpArt:
         mock_manager.get.assert_called_once()
 
 
+class TestArtCache:
+    """Test the decoded album art LRU cache."""
+
+    @staticmethod
+    def _pixmap() -> QPixmap:
+        image = QImage(8, 8, QImage.Format.Format_RGB32)
+        image.fill(0x00FF00)
+        return QPixmap.fromImage(image)
+
+    def test_cached_http_art_skips_request(self, qtbot: QtBot) -> None:
+        """Test a cached URL is displayed without a network request."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        pixmap = self._pixmap()
+        panel._cache_art("http://example.com/art.jpg", pixmap)
+
+        mock_manager = MagicMock()
+        with patch.object(panel, "_network_manager", mock_manager):
+            panel._fetch_http_art("http://example.com/art.jpg")
+
+        mock_manager.get.assert_not_called()
+        assert panel._original_pixmap is not None
+        assert panel._original_pixmap.cacheKey() == pixmap.cacheKey()
+        assert panel._art_loaded is True
+
+    def test_cached_data_uri_skips_decode(self, qtbot: QtBot) -> None:
+        """Test a data URI decoded once is reused without a decode thread."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        data_uri = "data:image/jpeg;base64," + base64.b64encode(b"image").decode()
+
+        with patch("snapctrl.ui.panels.sources.threading.Thread") as mock_thread:
+            panel._load_data_uri_image(data_uri)
+            panel._cache_art(panel._pending_art_key, self._pixmap())
+            assert panel._load_data_uri_image(data_uri) is True
+
+        mock_thread.assert_called_once()
+
+    def test_cached_fallback_skips_fetch(self, qtbot: QtBot) -> None:
+        """Test fallback art is keyed by track metadata."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        panel._current_artist = "Artist"
+        panel._current_album = "Album"
+        panel._current_title = "Title"
+        panel._art_loaded = False
+        panel._cache_art("Artist|Album|Title", self._pixmap())
+
+        with patch("snapctrl.ui.panels.sources.asyncio.run_coroutine_threadsafe") as mock_run:
+            panel._try_fallback_art()
+
+        mock_run.assert_not_called()
+        assert panel._original_pixmap is not None
+
+    def test_hit_invalidates_pending_load(self, qtbot: QtBot) -> None:
+        """Test a cache hit bumps the generation so stale results are dropped."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        panel._cache_art("key", self._pixmap())
+        generation = panel._fallback_generation
+
+        assert panel._show_cached_art("key") is True
+        assert panel._fallback_generation == generation + 1
+
+    def test_cache_shared_between_panels(self, qtbot: QtBot) -> None:
+        """Test art cached by one panel is a hit for another."""
+        first = SourcesPanel()
+        second = SourcesPanel()
+        qtbot.addWidget(first)
+        qtbot.addWidget(second)
+        pixmap = self._pixmap()
+        first._cache_art("http://example.com/art.jpg", pixmap)
+
+        assert second._show_cached_art("http://example.com/art.jpg") is True
+        assert second._original_pixmap is not None
+        assert second._original_pixmap.cacheKey() == pixmap.cacheKey()
+
+
+class TestCancelHttpArt:
+    """Test aborting superseded HTTP album art requests."""
+
+    def test_new_url_aborts_previous_reply(self, qtbot: QtBot) -> None:
+        """Test fetching a different URL aborts the in-flight reply."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        first_reply, second_reply = MagicMock(), MagicMock()
+        mock_manager = MagicMock()
+        mock_manager.get.side_effect = [first_reply, second_reply]
+
+        with patch.object(panel, "_network_manager", mock_manager):
+            panel._fetch_http_art("http://example.com/a.jpg")
+            panel._fetch_http_art("http://example.com/b.jpg")
+
+        first_reply.abort.assert_called_once()
+        second_reply.abort.assert_not_called()
+        assert panel._current_reply is second_reply
+        assert panel._pending_art_url == "http://example.com/b.jpg"
+
+    def test_non_http_art_aborts_reply(self, qtbot: QtBot) -> None:
+        """Test switching to a source without HTTP art aborts the download."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        reply = MagicMock()
+        panel._current_reply = reply
+        panel._pending_art_url = "http://example.com/a.jpg"
+
+        panel._set_album_art("")
+
+        reply.abort.assert_called_once()
+        assert panel._current_reply is None
+        assert panel._pending_art_url == ""
+
+    @pytest.mark.parametrize(
+        ("received", "total"),
+        [(0, MAX_HTTP_ART_SIZE + 1), (MAX_HTTP_ART_SIZE + 1, -1)],
+    )
+    def test_oversized_download_aborted(self, qtbot: QtBot, received: int, total: int) -> None:
+        """Test art over the size cap is aborted by Content-Length or bytes received."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        reply = MagicMock()
+        panel._current_reply = reply
+        panel._pending_art_url = "http://example.com/huge.jpg"
+
+        with patch.object(panel, "_try_fallback_art") as fallback:
+            panel._on_http_art_progress(reply, received, total)
+
+        reply.abort.assert_called_once()
+        fallback.assert_called_once()
+        assert panel._current_reply is None
+
+    def test_download_within_cap_continues(self, qtbot: QtBot) -> None:
+        """Test art within the size cap, or from a superseded reply, is left alone."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        reply, stale_reply = MagicMock(), MagicMock()
+        panel._current_reply = reply
+
+        panel._on_http_art_progress(reply, 1024, MAX_HTTP_ART_SIZE)
+        panel._on_http_art_progress(stale_reply, 0, MAX_HTTP_ART_SIZE + 1)
+
+        reply.abort.assert_not_called()
+        stale_reply.abort.assert_not_called()
+        assert panel._current_reply is reply
+
+
+class TestRewriteArtUrl:
+    """Test _rewrite_art_url host rewriting."""
+
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            (
+                "http://localhost:1780/__image_cache?name=abc",
+                "http://192.168.1.100:1780/__image_cache?name=abc",
+            ),
+            ("http://127.0.0.1/art.jpg", "http://192.168.1.100:80/art.jpg"),
+            ("https://LOCALHOST/art.jpg", "https://192.168.1.100:443/art.jpg"),
+            ("http://10.0.0.5:1780", "http://192.168.1.100:1780"),
+            ("http://[::1]:1780/art.jpg", "http://192.168.1.100:1780/art.jpg"),
+            ("http://user@localhost:1780/a.jpg", "http://192.168.1.100:1780/a.jpg"),
+            ("https://coverartarchive.org/release/1", "https://coverartarchive.org/release/1"),
+            ("http://192.168.1.100:1780/art.jpg", "http://192.168.1.100:1780/art.jpg"),
+        ],
+    )
+    def test_rewrite(self, qtbot: QtBot, url: str, expected: str) -> None:
+        """Test local hosts are rewritten and other hosts kept."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        panel._server_host = "192.168.1.100"
+
+        assert panel._rewrite_art_url(url) == expected
+
+
 class TestResizeEvent:
     """Test resize event handling."""
 
@@ -1036,3 +1675,39 @@ class TestOnHttpArtFinished:
 
         # Should not have changed pending URL (request ignored)
         assert panel._pending_art_url == "http://example.com/different.jpg"
+
+    def test_redirected_reply_cached_under_requested_url(self, qtbot: QtBot) -> None:
+        """Test a redirected reply is applied and cached by the URL that was requested."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        requested = "http://example.com/art.jpg"
+        panel._pending_art_url = requested
+
+        mock_reply = Mock()
+        mock_reply.url.return_value.toString.return_value = "http://cdn.example.com/x.png"
+        mock_reply.readAll.return_value.data.return_value = _encode_image(8, 8)
+        mock_reply.error.return_value = QNetworkReply.NetworkError.NoError
+        panel._current_reply = mock_reply
+
+        panel._on_http_art_finished(mock_reply)
+
+        assert panel._art_loaded is True
+        assert panel._current_reply is None
+        assert QPixmapCache.find(_ART_CACHE_PREFIX + requested) is not None
+
+    def test_superseded_reply_ignored_for_same_url(self, qtbot: QtBot) -> None:
+        """Test an older reply for the URL being fetched again is not applied."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        url = "http://example.com/art.jpg"
+        panel._pending_art_url = url
+        panel._current_reply = Mock()
+
+        old_reply = Mock()
+        old_reply.url.return_value.toString.return_value = url
+
+        panel._on_http_art_finished(old_reply)
+
+        old_reply.readAll.assert_not_called()
+        old_reply.deleteLater.assert_called_once()
+        assert panel._pending_art_url == url
@@ -4,12 +4,15 @@ from unittest.mock import MagicMock, patch
 
 from PySide6.QtCore import Qt
 
+from snapctrl.ui.panels.sources import SourcesPanel
 from snapctrl.ui.theme import (
     DARK_PALETTE,
     LIGHT_PALETTE,
     ThemeManager,
     ThemePalette,
 )
+from snapctrl.ui.widgets.client_card import ClientCard
+from snapctrl.ui.widgets.group_card import GroupCard
 
 
 class TestThemePalette:
@@ -239,6 +242,37 @@ class TestThemeManagerWithApp:
         assert "QLineEdit" in stylesheet
         assert "QScrollBar" in stylesheet
 
+    def test_global_stylesheet_styles_sources_panel(self, qtbot) -> None:  # type: ignore[no-untyped-def]
+        """Test that sources panel rules are keyed on its object names."""
+        panel = SourcesPanel()
+        qtbot.addWidget(panel)
+        stylesheet = ThemeManager()._global_stylesheet()
+
+        for widget in (panel._list, panel._details_frame, panel._progress_bar):
+            assert f"#{widget.objectName()}" in stylesheet
+            assert widget.styleSheet() == ""
+
+    def test_global_stylesheet_styles_group_card(self, qtbot) -> None:  # type: ignore[no-untyped-def]
+        """Test that group card rules are keyed on its object names."""
+        card = GroupCard()
+        qtbot.addWidget(card)
+        stylesheet = ThemeManager()._global_stylesheet()
+
+        for widget in (card, card._name_label, card._expand_button, card._source_label):
+            assert f"#{widget.objectName()}" in stylesheet
+            assert widget.styleSheet() == ""
+        assert '#GroupCard[selected="true"]' in stylesheet
+
+    def test_global_stylesheet_styles_client_card(self, qtbot) -> None:  # type: ignore[no-untyped-def]
+        """Test that client card frame rules are keyed on its object name."""
+        card = ClientCard(client_id="c1", name="Test")
+        qtbot.addWidget(card)
+        stylesheet = ThemeManager()._global_stylesheet()
+
+        assert f"#{card.objectName()}" in stylesheet
+        assert '#ClientCard[selected="true"]' in stylesheet
+        assert card.styleSheet() == ""
+
 
 class TestThemeManagerEdgeCases:
     """Test ThemeManager edge cases with mocked Qt APIs."""
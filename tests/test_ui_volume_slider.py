@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 from pytestqt.qtbot import QtBot
 
 from snapctrl.ui.widgets.volume_slider import VolumeSlider
@@ -97,6 +99,29 @@ class TestVolumeSliderSetVolume:
         assert slider.volume == 0
         assert slider._volume_before_mute == 80
 
+    def test_set_volume_unchanged_skips_widget_writes(self, qtbot: QtBot) -> None:
+        """Test repeating the current volume leaves the slider and label alone."""
+        slider = VolumeSlider()
+        qtbot.addWidget(slider)
+        slider.set_volume(80)
+
+        with patch.object(slider._volume_label, "setText") as set_text:
+            slider.set_volume(80)
+
+        set_text.assert_not_called()
+
+    def test_set_volume_after_drag_restores_stored_volume(self, qtbot: QtBot) -> None:
+        """Test a user drag does not make the server volume look unchanged."""
+        slider = VolumeSlider()
+        qtbot.addWidget(slider)
+        slider.set_volume(80)
+        slider._slider.setValue(30)
+
+        slider.set_volume(30)
+
+        assert slider.volume == 30
+        assert slider._volume_before_mute == 30
+
 
 class TestVolumeSliderSetMuted:
     """Test set_muted method."""
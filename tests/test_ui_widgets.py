@@ -124,6 +124,42 @@ class TestGroupCard:
         assert card._source_combo.count() == 2
         assert card._source_combo.itemText(0) == "MPD"
 
+    def test_update_from_state_skips_unchanged_labels(self, qtbot: QtBot) -> None:
+        """Test repeated state leaves the name and client count labels alone."""
+        group = Group(id="g1", name="Test", stream_id="s1", muted=False, client_ids=["c1"])
+        clients = [Client(id="c1", host="h", name="C1", volume=50, connected=True)]
+        card = GroupCard(group)
+        qtbot.addWidget(card)
+        card.set_expanded(True)
+        card.update_from_state(group, [], clients)
+
+        with (
+            patch.object(card._name_label, "setText") as set_name,
+            patch.object(card._client_list_label, "setText") as set_count,
+        ):
+            card.update_from_state(group, [], clients)
+
+        set_name.assert_not_called()
+        set_count.assert_not_called()
+
+    def test_update_from_state_keeps_combo_for_metadata_changes(self, qtbot: QtBot) -> None:
+        """Test metadata-only source updates reuse the combo and follow the stream."""
+        group = Group(id="g1", name="Test", stream_id="s1", muted=False, client_ids=[])
+        card = GroupCard(group)
+        qtbot.addWidget(card)
+        card.set_sources([Source(id="s1", name="MPD"), Source(id="s2", name="Spotify")])
+
+        moved = Group(id="g1", name="Test", stream_id="s2", muted=False, client_ids=[])
+        playing = [
+            Source(id="s1", name="MPD", meta_title="Song"),
+            Source(id="s2", name="Spotify"),
+        ]
+        with patch.object(card._source_combo, "clear") as clear:
+            card.update_from_state(moved, playing)
+
+        clear.assert_not_called()
+        assert card._source_combo.currentData() == "s2"
+
     def test_expand_toggle(self, qtbot: QtBot) -> None:
         """Test expand/collapse functionality."""
         card = GroupCard()
@@ -131,7 +167,7 @@ class TestGroupCard:
         card.show()  # Widget must be shown for isVisible() to work
 
         assert not card._expanded
-        assert card._client_list.isHidden()
+        assert card._client_list is None
 
         card._toggle_expand()
         assert card._expanded
@@ -181,9 +217,11 @@ class TestGroupCardSelection:
 
         card.set_selected(True)
         assert card._selected is True
+        assert card.property("selected") is True
 
         card.set_selected(False)
         assert card._selected is False
+        assert card.property("selected") is False
 
     def test_clicked_signal(self, qtbot: QtBot) -> None:
         """Test clicked signal emission on mouse press."""
@@ -238,6 +276,34 @@ class TestGroupCardSourceChange:
         assert len(received) == 1
         assert received[0] == ("g1", "s2")
 
+    def test_source_changed_between_same_named_sources(self, qtbot: QtBot) -> None:
+        """Test switching between sources that share a name still emits."""
+        group = Group(id="g1", name="Test", stream_id="s1", muted=False, client_ids=[])
+        card = GroupCard(group)
+        qtbot.addWidget(card)
+        card.set_sources([Source(id="s1", name="Pipe"), Source(id="s2", name="Pipe")])
+
+        received: list[tuple[str, str]] = []
+        card.source_changed.connect(lambda gid, sid: received.append((gid, sid)))
+        card._source_combo.setCurrentIndex(1)
+
+        assert received == [("g1", "s2")]
+
+    def test_set_sources_rebuilds_with_updates_off(self, qtbot: QtBot) -> None:
+        """Test the combo rebuild runs with painting suspended, then restores it."""
+        card = GroupCard()
+        qtbot.addWidget(card)
+        combo = card._source_combo
+        states: list[bool] = []
+
+        with patch.object(
+            combo, "addItem", side_effect=lambda *_a: states.append(combo.updatesEnabled())
+        ):
+            card.set_sources([Source(id="s1", name="MPD"), Source(id="s2", name="Pipe")])
+
+        assert states == [False, False]
+        assert combo.updatesEnabled() is True
+
 
 class TestGroupCardExpand:
     """Test GroupCard expand functionality."""
@@ -262,6 +328,19 @@ class TestGroupCardExpand:
         assert len(received) == 1
         assert received[0] == ("g1", True)
 
+    def test_toggle_expand_uses_group_set_later(self, qtbot: QtBot) -> None:
+        """Test signals carry the ID of a group assigned after construction."""
+        card = GroupCard()
+        qtbot.addWidget(card)
+        received: list[tuple[str, bool]] = []
+        card.expand_toggled.connect(lambda gid, exp: received.append((gid, exp)))
+
+        card._toggle_expand()
+        card.set_group(Group(id="g2", name="Later", stream_id="s1", muted=False, client_ids=[]))
+        card._toggle_expand()
+
+        assert received == [("", True), ("g2", False)]
+
     def test_set_expanded(self, qtbot: QtBot) -> None:
         """Test set_expanded method."""
         card = GroupCard()
@@ -311,6 +390,22 @@ class TestGroupCardVolume:
         assert len(received) == 1
         assert received[0] == ("g1", 75)
 
+    def test_volume_drag_coalesced(self, qtbot: QtBot) -> None:
+        """Test rapid slider changes emit the first value, then only the latest."""
+        group = Group(id="g1", name="Test", stream_id="s1", muted=False, client_ids=[])
+        card = GroupCard(group)
+        qtbot.addWidget(card)
+
+        received: list[tuple[str, int]] = []
+        card.volume_changed.connect(lambda gid, vol: received.append((gid, vol)))
+
+        for vol in (10, 20, 30, 40):
+            card._on_volume_slider_changed(vol)
+        assert received == [("g1", 10)]
+
+        qtbot.waitUntil(lambda: len(received) == 2)
+        assert received[1] == ("g1", 40)
+
     def test_mute_toggled_signal(self, qtbot: QtBot) -> None:
         """Test mute toggled signal emission."""
         group = Group(
@@ -385,6 +480,7 @@ class TestGroupCardUpdateFromState:
             Source(id="s1", name="MPD", status="playing", stream_type="flac"),
         ]
 
+        card.set_expanded(True)
         card.update_from_state(group, sources, clients)
 
         # Should have created client cards
@@ -392,30 +488,20 @@ class TestGroupCardUpdateFromState:
         assert "c2" in card._client_cards
 
 
-class TestGroupCardEventFilter:
-    """Test GroupCard event filter."""
+class TestGroupCardNameClick:
+    """Test GroupCard name label clicks."""
 
-    def test_event_filter_name_label_click(self, qtbot: QtBot) -> None:
-        """Test event filter handles clicks on name label."""
+    def test_name_label_click_emits_once(self, qtbot: QtBot) -> None:
+        """Test a press on the name label emits clicked once, without reaching the card."""
         card = GroupCard()
         qtbot.addWidget(card)
+        card.show()
 
         received: list[bool] = []
         card.clicked.connect(lambda: received.append(True))
 
-        # Create mouse press event
-        event = QMouseEvent(
-            QEvent.Type.MouseButtonPress,
-            QPointF(0, 0),
-            Qt.MouseButton.LeftButton,
-            Qt.MouseButton.LeftButton,
-            Qt.KeyboardModifier.NoModifier,
-        )
+        qtbot.mouseClick(card._name_label, Qt.MouseButton.LeftButton)
 
-        # Send event to name label through filter
-        result = card.eventFilter(card._name_label, event)
-
-        assert result is True
         assert received == [True]
 
 
@@ -662,6 +748,7 @@ class TestGroupCardClearClients:
         )
         card = GroupCard(group)
         qtbot.addWidget(card)
+        card.set_expanded(True)
 
         # Add initial clients
         clients1 = [Client(id="c1", host="h", name="C1", volume=50, connected=True)]
@@ -676,6 +763,180 @@ class TestGroupCardClearClients:
         assert "c1" not in card._client_cards
         assert "c2" in card._client_cards
 
+    def test_collapsed_card_defers_client_cards(self, qtbot: QtBot) -> None:
+        """Test a collapsed card keeps its clients, building the list on expand."""
+        card = GroupCard()
+        qtbot.addWidget(card)
+        c1 = Client(id="c1", host="h", name="C1", volume=50, connected=True)
+        card.update_clients([c1])
+        card.update_clients([c1, Client(id="c2", host="h", name="C2", volume=60)])
+
+        assert card._client_cards == {}
+        assert card._client_list is None
+
+        card.set_expanded(True)
+
+        assert list(card._client_cards) == ["c1", "c2"]
+        assert card._client_list_label.text() == "Clients: (2)"
+        assert card._pending_clients is None
+
+    def test_collapsed_client_volume_survives_expand(self, qtbot: QtBot) -> None:
+        """Test a volume set while collapsed is not undone by the pending snapshot."""
+        card = GroupCard()
+        qtbot.addWidget(card)
+        client = Client(id="c1", host="h", name="C1", volume=50, connected=True)
+        card.set_expanded(True)
+        card.update_clients([client])
+        card.set_expanded(False)
+        card.update_clients([client])
+
+        card.set_client_volume("c1", 70)
+        card.set_expanded(True)
+
+        assert card._client_cards["c1"]._volume_slider.volume == 70
+
+    def _collapsed_card_with_clients(self, qtbot: QtBot) -> GroupCard:
+        """Build a never-expanded card holding two pending clients."""
+        card = GroupCard()
+        qtbot.addWidget(card)
+        card.update_clients(
+            [
+                Client(id="c1", host="h", name="C1", volume=50, connected=True),
+                Client(id="c2", host="h", name="C2", volume=60, connected=True),
+            ]
+        )
+        assert card._client_list is None
+        return card
+
+    def test_unbuilt_list_keeps_client_volume(self, qtbot: QtBot) -> None:
+        """Test set_client_volume before the list exists shows on first expand."""
+        card = self._collapsed_card_with_clients(qtbot)
+
+        card.set_client_volume("c1", 20)
+        card.set_expanded(True)
+
+        assert card._client_cards["c1"]._volume_slider.volume == 20
+        assert card._client_cards["c2"]._volume_slider.volume == 60
+
+    def test_unbuilt_list_keeps_client_mute(self, qtbot: QtBot) -> None:
+        """Test set_client_muted before the list exists shows on first expand."""
+        card = self._collapsed_card_with_clients(qtbot)
+
+        card.set_client_muted("c2", True)
+        card.set_expanded(True)
+
+        assert card._client_cards["c2"]._volume_slider.is_muted
+        assert not card._client_cards["c1"]._volume_slider.is_muted
+
+    def test_unbuilt_list_keeps_followed_volumes(self, qtbot: QtBot) -> None:
+        """Test set_all_client_volumes before the list exists shows on first expand."""
+        card = self._collapsed_card_with_clients(qtbot)
+
+        card.set_all_client_volumes({"c1": 30, "c2": 40})
+        card.set_expanded(True)
+
+        assert card._client_cards["c1"]._volume_slider.volume == 30
+        assert card._client_cards["c2"]._volume_slider.volume == 40
+
+    def test_unbuilt_list_keeps_selected_client(self, qtbot: QtBot) -> None:
+        """Test set_selected_client before the list exists shows on first expand."""
+        card = self._collapsed_card_with_clients(qtbot)
+
+        card.set_selected_client("c2")
+        card.set_expanded(True)
+
+        assert card._client_cards["c2"]._selected is True
+        assert card._client_cards["c1"]._selected is False
+
+    def test_update_clients_reuses_existing_cards(self, qtbot: QtBot) -> None:
+        """Test known clients keep their card, updated in place and reordered."""
+        card = GroupCard()
+        qtbot.addWidget(card)
+        card.set_expanded(True)
+        c1 = Client(id="c1", host="h", name="C1", volume=50, connected=True)
+        c2 = Client(id="c2", host="h", name="C2", volume=60, connected=True)
+        card.update_clients([c1, c2])
+        first, second = card._client_cards["c1"], card._client_cards["c2"]
+
+        renamed = Client(id="c1", host="h", name="Kitchen", volume=20, connected=False)
+        card.update_clients([c2, renamed])
+
+        assert card._client_cards["c1"] is first
+        assert card._client_cards["c2"] is second
+        assert first.name == "Kitchen"
+        assert first._connected is False
+        assert card._clients_layout.indexOf(second) == 0
+        assert card._clients_layout.indexOf(first) == 1
+
+    def test_update_clients_same_order_skips_layout(self, qtbot: QtBot) -> None:
+        """Test an unchanged client order refreshes cards without layout lookups."""
+        card = GroupCard()
+        qtbot.addWidget(card)
+        card.set_expanded(True)
+        c1 = Client(id="c1", host="h", name="C1", volume=50, connected=True)
+        c2 = Client(id="c2", host="h", name="C2", volume=60, connected=True)
+        card.update_clients([c1, c2])
+
+        with patch.object(card._clients_layout, "indexOf") as index_of:
+            card.update_clients([c1, Client(id="c2", host="h", name="Den", volume=60)])
+
+        index_of.assert_not_called()
+        assert card._client_cards["c2"].name == "Den"
+
+    def test_client_signals_forwarded(self, qtbot: QtBot) -> None:
+        """Test client card signals are relayed through the group card's signals."""
+        card = GroupCard()
+        qtbot.addWidget(card)
+        card.set_expanded(True)
+        card.update_clients([Client(id="c1", host="h", name="C1", volume=50, connected=True)])
+        received: list[tuple[str, int]] = []
+        card.client_volume_changed.connect(lambda cid, vol: received.append((cid, vol)))
+
+        card._client_cards["c1"].volume_changed.emit("c1", 42)
+
+        assert received == [("c1", 42)]
+
+    def test_set_selected_client_moves_selection(self, qtbot: QtBot) -> None:
+        """Test selection moves between cards and applies to cards added later."""
+        card = GroupCard()
+        qtbot.addWidget(card)
+        card.set_expanded(True)
+        c1 = Client(id="c1", host="h", name="C1", volume=50, connected=True)
+        c2 = Client(id="c2", host="h", name="C2", volume=50, connected=True)
+        card.update_clients([c1, c2])
+
+        card.set_selected_client("c1")
+        card.set_selected_client("c2")
+        assert card._client_cards["c1"]._selected is False
+        assert card._client_cards["c2"]._selected is True
+
+        card.update_clients([c1])
+        card.update_clients([c1, c2])
+        assert card._client_cards["c2"]._selected is True
+
+        card.set_selected_client(None)
+        assert not any(c._selected for c in card._client_cards.values())
+
+    def test_update_clients_suspends_painting(self, qtbot: QtBot) -> None:
+        """Test card changes happen with updates off, re-enabled afterwards."""
+        card = GroupCard()
+        qtbot.addWidget(card)
+        card.set_expanded(True)
+        states: list[bool] = []
+        client = Client(id="c1", host="h", name="C1", volume=50, connected=True)
+        card.update_clients([client])
+
+        with patch.object(
+            card._client_cards["c1"],
+            "update_from_client",
+            side_effect=lambda _c: states.append(card._clients_container.updatesEnabled()),
+        ):
+            card.update_clients([client])
+
+        assert states == [False]
+        assert card._clients_container.updatesEnabled() is True
+        assert card._client_cards["c1"].updatesEnabled() is True
+
 
 class TestGroupCardVolumeEdgeCases:
     """Test GroupCard volume calculation edge cases."""
@@ -702,6 +963,20 @@ class TestGroupCardVolumeEdgeCases:
         # Should use average of all clients
         assert card._volume_slider.volume == 70
 
+    def test_volume_averages_connected_clients_only(self, qtbot: QtBot) -> None:
+        """Test disconnected clients are left out when any client is connected."""
+        card = GroupCard()
+        qtbot.addWidget(card)
+
+        clients = [
+            Client(id="c1", host="h", name="C1", volume=80, connected=True),
+            Client(id="c2", host="h", name="C2", volume=10, connected=False),
+            Client(id="c3", host="h", name="C3", volume=41, connected=True),
+        ]
+        card._update_group_volume_from_clients(clients)
+
+        assert card._volume_slider.volume == 60
+
     def test_volume_no_clients(self, qtbot: QtBot) -> None:
         """Test volume when no clients exist."""
         group = Group(